@@ -6,4 +6,14 @@ from django.contrib import admin
 from .models import PurchaseOrder
 
 
-admin.site.register(PurchaseOrder)
+@admin.register(PurchaseOrder)
+class PurchaseOrderAdmin(admin.ModelAdmin):
+    """
+        Purchase orders show their vendor name, read with
+        a join instead of one query per row.
+    """
+    list_display = ['po_number', 'vendor', 'status', 'order_date']
+    list_filter = ['status']
+    list_select_related = ['vendor']
+    search_fields = ['po_number']
+    raw_id_fields = ['vendor']
@@ -0,0 +1,92 @@
+"""
+    Streaming export of purchase orders.
+
+    Rows are read with queryset.values().iterator() in
+    chunks and written one by one, so an export of any
+    size keeps a flat memory use.
+"""
+import csv
+import io
+
+from vendor.renderers import FastJSONRenderer
+from vendor.values import ValuesSerializer
+
+
+FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def export_rows(queryset, serializer, chunk_size=2000):
+    """
+        Yield the representation of each purchase order,
+        the same as the one of the list endpoint.
+
+    Args:
+        queryset (type = QuerySet) filtered purchase orders.
+        serializer (type = PurchaseOrderSerializer) gives the fields.
+        chunk_size (type = int) rows fetched from the database at once.
+    """
+    fast = ValuesSerializer.compile(serializer)
+    rows = queryset.order_by('order_date', 'id').values(*fast.lookups)
+
+    for row in rows.iterator(chunk_size=chunk_size):
+        yield fast.to_representation(row)
+
+
+def export_lines(rows, fields, file_format):
+    """
+        Yield the lines of the export file as bytes.
+
+    Args:
+        rows (type = iterable) representations of purchase orders.
+        fields (type = list) names of the fields, the CSV header.
+        file_format (type = str) csv or ndjson.
+    """
+    renderer = FastJSONRenderer()
+
+    if file_format == 'ndjson':
+        for row in rows:
+            yield renderer.render(row) + b'\n'
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def line(values):
+        writer.writerow(values)
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value.encode()
+
+    yield line(fields)
+    for row in rows:
+        yield line(
+            # Nested JSON, like items, is written as JSON text.
+            renderer.render(value).decode()
+            if isinstance(value, (dict, list)) else value
+            for value in row.values()
+        )
+
+
+def export_purchase_orders(queryset, serializer, file_format,
+                           chunk_size=2000):
+    """
+        Return the lines of the export file of the purchase
+        orders. The fields are checked before streaming.
+
+    Args:
+        queryset (type = QuerySet) filtered purchase orders.
+        serializer (type = PurchaseOrderSerializer) gives the fields,
+        its request selects them with fields / exclude.
+        file_format (type = str) csv or ndjson.
+        chunk_size (type = int) rows fetched from the database at once.
+    """
+    fields = [
+        name for name, field in serializer.fields.items()
+        if not field.write_only
+    ]
+    rows = export_rows(queryset, serializer, chunk_size)
+    return export_lines(rows, fields, file_format)
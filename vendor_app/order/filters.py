@@ -0,0 +1,42 @@
+"""
+    Filters of purchase order lists.
+"""
+import django_filters
+
+from django.utils import timezone
+
+from .models import PurchaseOrder
+
+
+class PurchaseOrderFilter(django_filters.FilterSet):
+    """
+        Filter purchase orders by vendor, status and dates.
+
+        Date ranges use the _after and _before suffixes,
+        e.g. order_date_after=2023-01-01T00:00:00Z.
+    """
+    order_date = django_filters.IsoDateTimeFromToRangeFilter()
+    delivery_date = django_filters.IsoDateTimeFromToRangeFilter()
+    date_delivered = django_filters.IsoDateTimeFromToRangeFilter()
+    acknowledged = django_filters.BooleanFilter(
+        field_name='acknowledgment_date',
+        lookup_expr='isnull',
+        exclude=True
+    )
+    overdue = django_filters.BooleanFilter(method='filter_overdue')
+
+    class Meta:
+        model = PurchaseOrder
+        fields = ['vendor', 'status']
+
+    def filter_overdue(self, queryset, name, value):
+        """
+            Orders still open after their delivery date.
+        """
+        overdue = {
+            'status__in': ['pending', 'out-to-deliver'],
+            'delivery_date__lt': timezone.now(),
+        }
+        if value:
+            return queryset.filter(**overdue)
+        return queryset.exclude(**overdue)
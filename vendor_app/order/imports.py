@@ -0,0 +1,185 @@
+"""
+    Streaming import of purchase orders.
+
+    The file is read line by line and inserted in
+    batches, so an import of any size keeps a flat
+    memory use. Invalid rows are reported and skipped,
+    the other rows are imported.
+"""
+import csv
+import json
+
+from django.db import IntegrityError
+from rest_framework.exceptions import ValidationError
+
+from vendor.renderers import orjson
+
+from .models import PurchaseOrder
+from .serializers import PurchaseOrderImportSerializer
+
+
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def read_rows(lines, file_format):
+    """
+        Yield the line number and data of each row of the
+        file, the data is None when the row can not be read.
+
+    Args:
+        lines (type = iterable) lines of the file as bytes.
+        file_format (type = str) csv or ndjson, CSV files
+        start with a header of field names.
+    """
+    lines = iter(lines)
+    first = next(lines, b'')
+    if first.startswith(b'\xef\xbb\xbf'):
+        first = first[3:]
+
+    def chain():
+        yield first
+        yield from lines
+
+    if file_format == 'ndjson':
+        for number, line in enumerate(chain(), start=1):
+            if not line.strip():
+                continue
+            try:
+                row = loads(line)
+            except ValueError:
+                row = None
+            yield number, row if isinstance(row, dict) else None
+        return
+
+    reader = csv.DictReader(
+        line.decode('utf-8', errors='replace') for line in chain()
+    )
+    for row in reader:
+        number = reader.line_num
+        if None in row:
+            # More values than header fields.
+            yield number, None
+            continue
+
+        # Empty cells are missing values.
+        row = {name: value for name, value in row.items() if value}
+        if 'items' in row:
+            try:
+                row['items'] = loads(row['items'])
+            except ValueError:
+                yield number, None
+                continue
+        yield number, row
+
+
+class PurchaseOrderImport:
+    """
+        Import purchase orders from the lines of a CSV or
+        NDJSON file.
+
+        Rows are validated with PurchaseOrderImportSerializer
+        and inserted in batches with bulk_ingest, which
+        applies the vendor performance changes of a batch
+        once per vendor and day.
+    """
+
+    def __init__(self, batch_size=1000, max_errors=1000):
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.created = 0
+        self.error_count = 0
+        self.errors = []
+        # One serializer validates every row, building its
+        # fields for each row is slower than the validation.
+        self.serializer = PurchaseOrderImportSerializer(
+            context={'vendors': {}}
+        )
+
+    def error(self, number, errors):
+        """
+            Report the errors of a row, only the first
+            max_errors are kept.
+        """
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'row': number, 'errors': errors})
+
+    def run(self, lines, file_format):
+        """
+            Import the rows.
+
+        Args:
+            lines (type = iterable) lines of the file as bytes.
+            file_format (type = str) csv or ndjson.
+        Returns:
+            self, read created, error_count and errors.
+        """
+        batch = []
+        for number, row in read_rows(lines, file_format):
+            if row is None:
+                self.error(number, {'non_field_errors': ['Invalid row.']})
+                continue
+
+            try:
+                data = self.serializer.run_validation(row)
+            except ValidationError as exc:
+                self.error(number, exc.detail)
+                continue
+
+            batch.append((number, data))
+            if len(batch) >= self.batch_size:
+                self.insert(batch)
+                batch = []
+
+        if batch:
+            self.insert(batch)
+
+        return self
+
+    def insert(self, batch):
+        """
+            Insert a batch of validated rows, skipping the
+            po_number values already used.
+        """
+        existing = set(
+            PurchaseOrder.objects.filter(
+                po_number__in=[data['po_number'] for _, data in batch]
+            ).values_list('po_number', flat=True)
+        )
+
+        rows = []
+        numbers = []
+        for number, data in batch:
+            if data['po_number'] in existing:
+                self.error(number, {'po_number': ['Duplicate po_number.']})
+                continue
+            existing.add(data['po_number'])
+            rows.append(data)
+            numbers.append(number)
+
+        try:
+            orders = PurchaseOrder.objects.bulk_ingest(
+                rows,
+                batch_size=self.batch_size
+            )
+        except IntegrityError:
+            # Some were inserted by someone else since the check,
+            # rows are inserted one by one to report only those.
+            orders = []
+            for number, data in zip(numbers, rows):
+                try:
+                    orders += PurchaseOrder.objects.bulk_ingest([data])
+                except IntegrityError:
+                    self.error(
+                        number,
+                        {'po_number': ['Duplicate po_number.']}
+                    )
+
+        self.created += len(orders)
+
+    def summary(self):
+        return {
+            'created': self.created,
+            'error_count': self.error_count,
+            'errors': self.errors,
+        }
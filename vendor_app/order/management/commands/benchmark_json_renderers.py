@@ -0,0 +1,146 @@
+"""
+    Command to compare the JSON renderers and parsers.
+"""
+import io
+import time
+from datetime import timedelta
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError
+)
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from order.models import PurchaseOrder
+from order.serializers import PurchaseOrderSerializer
+from vendor.parsers import FastJSONParser
+from vendor.renderers import (
+    FastJSONRenderer,
+    orjson
+)
+
+
+class Command(BaseCommand):
+    """
+        Render and parse a purchase order list page with the
+        rest framework JSON renderer / parser and with the
+        orjson ones, check both give the same bytes and data
+        and report the throughput of each.
+
+        The page is built in memory, no database rows are used.
+    """
+    help = 'Benchmark the JSON renderers and parsers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1000,
+            help='Number of purchase orders in the page.'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of runs of each path, the best is kept.'
+        )
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write('orjson is not installed, both paths use json.')
+
+        page = {
+            'next': None,
+            'previous': None,
+            'results': PurchaseOrderSerializer(
+                self.orders(options['rows']),
+                many=True
+            ).data,
+        }
+        repeat = options['repeat']
+
+        json_time, expected = self.best_time(
+            lambda: JSONRenderer().render(page),
+            repeat
+        )
+        fast_time, body = self.best_time(
+            lambda: FastJSONRenderer().render(page),
+            repeat
+        )
+        if body != expected:
+            raise CommandError('The renderers give different bytes.')
+        self.report('render', len(body), json_time, fast_time)
+
+        json_time, expected = self.best_time(
+            lambda: JSONParser().parse(io.BytesIO(body)),
+            repeat
+        )
+        fast_time, data = self.best_time(
+            lambda: FastJSONParser().parse(io.BytesIO(body)),
+            repeat
+        )
+        if data != expected:
+            raise CommandError('The parsers give different data.')
+        self.report('parse', len(body), json_time, fast_time)
+
+    def orders(self, count):
+        """
+            Build unsaved purchase orders like the stored ones.
+        """
+        now = timezone.now()
+        orders = []
+        for number in range(count):
+            ordered = now - timedelta(minutes=number, microseconds=number)
+            completed = number % 3 == 0
+            orders.append(
+                PurchaseOrder(
+                    id=number + 1,
+                    po_number=f'PO-{number:08d}',
+                    vendor_id=number % 50 + 1,
+                    order_date=ordered,
+                    delivery_date=ordered + timedelta(days=10),
+                    items={
+                        'lines': [
+                            {
+                                'sku': f'SKU-{number % 500:05d}-{line}',
+                                'description': 'Steel bolt M8 × 40 – zinc',
+                                'quantity': line + 1,
+                                'unit_price': 0.35 * (line + 1),
+                            }
+                            for line in range(number % 5 + 1)
+                        ],
+                        'notes': 'Deliver to dock 4',
+                    },
+                    quantity=number % 100 + 1,
+                    status='completed' if completed else 'pending',
+                    quality_rating=4.5 if completed else None,
+                    acknowledgment_date=(
+                        ordered + timedelta(hours=5) if completed else None
+                    ),
+                    date_delivered=(
+                        ordered + timedelta(days=8) if completed else None
+                    ),
+                )
+            )
+        return orders
+
+    def best_time(self, function, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = function()
+            elapsed = time.perf_counter() - started
+            if best is None or elapsed < best:
+                best = elapsed
+        return best, result
+
+    def report(self, name, size, json_time, fast_time):
+        megabytes = size / 1024 / 1024
+        self.stdout.write(
+            f'{name}: {size} bytes, '
+            f'json {megabytes / json_time:.1f} MB/s, '
+            f'orjson {megabytes / fast_time:.1f} MB/s, '
+            f'{json_time / fast_time:.1f}x faster.'
+        )
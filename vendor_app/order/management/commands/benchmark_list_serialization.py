@@ -0,0 +1,127 @@
+"""
+    Command to compare the list serialization paths.
+"""
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import (
+    BaseCommand,
+    CommandError
+)
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from order.models import PurchaseOrder
+from order.serializers import PurchaseOrderSerializer
+from vendor.serializers import VendorSerializer
+from vendor.values import ValuesSerializer
+
+
+class Command(BaseCommand):
+    """
+        Serialize the purchase order and vendor lists with
+        the model serializers and with the values() fast
+        path, check both render the same bytes and report
+        the rows serialized per second of each.
+
+        Rows added with --rows are removed at the end.
+    """
+    help = 'Benchmark the list serialization paths.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=0,
+            help='Number of purchase orders added for the run.'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of runs of each path, the best is kept.'
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options['rows']:
+                self.add_rows(options['rows'])
+
+            lists = [
+                (
+                    'purchase orders',
+                    PurchaseOrder.objects.order_by('order_date', 'id'),
+                    PurchaseOrderSerializer
+                ),
+                (
+                    'vendors',
+                    get_user_model().objects.filter(
+                        is_seller=True
+                    ).order_by('id').prefetch_related('vendor_data'),
+                    VendorSerializer
+                ),
+            ]
+            for name, queryset, serializer_class in lists:
+                self.benchmark(
+                    name,
+                    queryset,
+                    serializer_class,
+                    options['repeat']
+                )
+
+            transaction.set_rollback(True)
+
+    def add_rows(self, count):
+        vendor = get_user_model().objects.filter(is_seller=True).first()
+        if vendor is None:
+            raise CommandError('Create a vendor to add purchase orders.')
+
+        PurchaseOrder.objects.bulk_ingest(
+            {
+                'po_number': f'benchmark-{number}',
+                'items': {'item': 'benchmark', 'number': number},
+                'quantity': number % 100 + 1,
+                'vendor': vendor,
+            }
+            for number in range(count)
+        )
+
+    def best_time(self, function, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = function()
+            elapsed = time.perf_counter() - started
+            if best is None or elapsed < best:
+                best = elapsed
+        return best, result
+
+    def benchmark(self, name, queryset, serializer_class, repeat):
+        fast = ValuesSerializer.compile(serializer_class())
+
+        serializer_time, expected = self.best_time(
+            lambda: serializer_class(queryset.all(), many=True).data,
+            repeat
+        )
+        values_time, data = self.best_time(
+            lambda: fast.serialize(
+                queryset.prefetch_related(None).values(*fast.lookups)
+            ),
+            repeat
+        )
+
+        renderer = JSONRenderer()
+        if renderer.render(expected) != renderer.render(data):
+            raise CommandError(f'The {name} paths render different bytes.')
+
+        rows = len(data)
+        if not rows:
+            self.stdout.write(f'No {name} to serialize.')
+            return
+
+        self.stdout.write(
+            f'{name}: {rows} rows, '
+            f'serializer {rows / serializer_time:.0f} rows/s, '
+            f'values {rows / values_time:.0f} rows/s, '
+            f'{serializer_time / values_time:.1f}x faster.'
+        )
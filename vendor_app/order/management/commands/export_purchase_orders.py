@@ -0,0 +1,122 @@
+"""
+    Command to export purchase orders to a file.
+"""
+from django.core.management.base import (
+    BaseCommand,
+    CommandError
+)
+
+from order.export import (
+    FORMATS,
+    export_purchase_orders
+)
+from order.filters import PurchaseOrderFilter
+from order.models import PurchaseOrder
+from order.serializers import PurchaseOrderSerializer
+
+
+# Date range filters of PurchaseOrderFilter, each one is given as
+# --<name>-after and --<name>-before.
+RANGE_FILTERS = ['order_date', 'delivery_date', 'date_delivered']
+
+
+class Command(BaseCommand):
+    """
+        Write purchase orders as CSV or NDJSON, the same
+        file as the export endpoint. Orders are read in
+        chunks and written as they come, so memory use
+        does not grow with the number of orders.
+    """
+    help = 'Export purchase orders as CSV or NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--file-format',
+            choices=list(FORMATS),
+            default='csv',
+            help='Format of the export.'
+        )
+        parser.add_argument(
+            '--output',
+            help='Path of the file to write, standard output by default.'
+        )
+        parser.add_argument(
+            '--vendor',
+            type=int,
+            help='Id of the vendor to export.'
+        )
+        parser.add_argument(
+            '--status',
+            help='Status of the orders to export.'
+        )
+        for name in RANGE_FILTERS:
+            option = name.replace('_', '-')
+            label = name.replace('_', ' ')
+            parser.add_argument(
+                f'--{option}-after',
+                *(['--from'] if name == 'order_date' else []),
+                dest=f'{name}_after',
+                help=f'Export orders with a {label} at or after this '
+                     'ISO datetime.'
+            )
+            parser.add_argument(
+                f'--{option}-before',
+                *(['--to'] if name == 'order_date' else []),
+                dest=f'{name}_before',
+                help=f'Export orders with a {label} at or before this '
+                     'ISO datetime.'
+            )
+        parser.add_argument(
+            '--acknowledged',
+            choices=['true', 'false'],
+            help='Export only acknowledged or unacknowledged orders.'
+        )
+        parser.add_argument(
+            '--overdue',
+            choices=['true', 'false'],
+            help='Export only orders open past their delivery date, '
+                 'or only the others.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help='Number of orders read from the database at once.'
+        )
+
+    def handle(self, *args, **options):
+        data = {
+            name: options[name]
+            for name in ['vendor', 'status', 'acknowledged', 'overdue'] + [
+                f'{name}_{suffix}'
+                for name in RANGE_FILTERS
+                for suffix in ['after', 'before']
+            ]
+            if options[name] is not None
+        }
+        filterset = PurchaseOrderFilter(
+            data,
+            queryset=PurchaseOrder.objects.all()
+        )
+        if not filterset.is_valid():
+            raise CommandError(filterset.errors.as_text())
+
+        lines = export_purchase_orders(
+            filterset.qs,
+            PurchaseOrderSerializer(),
+            options['file_format'],
+            chunk_size=options['chunk_size']
+        )
+
+        if options['output'] is None:
+            for line in lines:
+                self.stdout.write(line.decode(), ending='')
+            return
+
+        with open(options['output'], 'wb') as output:
+            for line in lines:
+                output.write(line)
+
+        self.stderr.write(
+            self.style.SUCCESS(f'Exported to {options["output"]}.')
+        )
@@ -0,0 +1,83 @@
+"""
+    Command to import purchase orders from a file.
+"""
+import json
+import time
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError
+)
+
+from order.export import FORMATS
+from order.imports import PurchaseOrderImport
+
+
+class Command(BaseCommand):
+    """
+        Import purchase orders from a CSV or NDJSON file,
+        like the ones written by export_purchase_orders.
+
+        The file is read line by line and inserted in
+        batches. Invalid rows are reported and skipped.
+        The vendor performance is updated once per vendor
+        and day of each batch.
+    """
+    help = 'Import purchase orders from a CSV or NDJSON file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='Path of the file to import.'
+        )
+        parser.add_argument(
+            '--file-format',
+            choices=list(FORMATS),
+            help='Format of the file, from its extension by default.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of orders inserted per query.'
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        path = options['path']
+
+        file_format = options['file_format']
+        if file_format is None:
+            file_format = path.rsplit('.', 1)[-1].lower()
+            if file_format == 'jsonl':
+                file_format = 'ndjson'
+            if file_format not in FORMATS:
+                raise CommandError(
+                    'Unknown file format, use --file-format.'
+                )
+
+        try:
+            with open(path, 'rb') as lines:
+                result = PurchaseOrderImport(
+                    batch_size=options['batch_size']
+                ).run(lines, file_format)
+        except OSError as exc:
+            raise CommandError(exc)
+
+        for error in result.errors:
+            self.stderr.write(
+                f"Row {error['row']}: {json.dumps(error['errors'])}"
+            )
+        if result.error_count > len(result.errors):
+            self.stderr.write(
+                f'{result.error_count - len(result.errors)} more errors.'
+            )
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Imported {result.created} purchase orders '
+                f'with {result.error_count} errors '
+                f'in {elapsed:.2f} seconds.'
+            )
+        )
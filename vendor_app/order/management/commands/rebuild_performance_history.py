@@ -0,0 +1,78 @@
+"""
+    Command to rebuild the daily vendor performance rollups.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from order.models import PurchaseOrder
+from vendor.models import (
+    DailyVendorPerformance,
+    VendorPerformance
+)
+
+
+class Command(BaseCommand):
+    """
+        Replace the daily vendor performance rollups with
+        values grouped by vendor and day from the purchase
+        orders.
+    """
+    help = 'Rebuild daily vendor performance rollups from purchase orders.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--vendor',
+            type=int,
+            action='append',
+            dest='vendors',
+            help='Id of the vendor to rebuild. Can be repeated.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of rollups inserted per query.'
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        vendor_ids = options['vendors']
+
+        counters = PurchaseOrder.objects.performance_counters(
+            vendor_ids,
+            by_day=True
+        )
+
+        rollups = []
+        for (vendor_id, day), values in counters.items():
+            rollup = DailyVendorPerformance(vendor_id=vendor_id, day=day)
+            rollup.set_counters(values)
+            rollups.append(rollup)
+
+        with transaction.atomic():
+            existing = DailyVendorPerformance.objects.all()
+            if vendor_ids is not None:
+                existing = existing.filter(vendor_id__in=vendor_ids)
+            existing.delete()
+
+            DailyVendorPerformance.objects.bulk_create(
+                rollups,
+                batch_size=options['batch_size']
+            )
+
+        if vendor_ids is None:
+            vendor_ids = VendorPerformance.objects.values_list(
+                'vendor_id',
+                flat=True
+            )
+        VendorPerformance.invalidate_cached_metrics(vendor_ids)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Rebuilt {len(rollups)} daily rollups '
+                f'in {elapsed:.2f} seconds.'
+            )
+        )
@@ -0,0 +1,80 @@
+"""
+    Command to rebuild vendor performance data from purchase orders.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from order.models import PurchaseOrder
+from vendor.models import VendorPerformance
+
+
+class Command(BaseCommand):
+    """
+        Recompute the counters and rates of VendorPerformance
+        instances with grouped aggregate queries over the
+        purchase orders and save them with bulk_update.
+    """
+    help = 'Recompute vendor performance data from purchase orders.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--vendor',
+            type=int,
+            action='append',
+            dest='vendors',
+            help='Id of the vendor to recompute. Can be repeated.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of performance instances saved per query.'
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        vendor_ids = options['vendors']
+        batch_size = options['batch_size']
+
+        counters = PurchaseOrder.objects.performance_counters(vendor_ids)
+
+        queryset = VendorPerformance.objects.order_by('id')
+        if vendor_ids is not None:
+            queryset = queryset.filter(vendor_id__in=vendor_ids)
+
+        fields = (
+            VendorPerformance.COUNTER_FIELDS +
+            VendorPerformance.RATE_FIELDS +
+            ['updated_at']
+        )
+        now = timezone.now()
+        batch = []
+        updated = 0
+
+        for perf_ins in queryset.iterator(chunk_size=batch_size):
+            perf_ins.set_counters(counters.get(perf_ins.vendor_id, {}))
+            perf_ins.updated_at = now
+            batch.append(perf_ins)
+
+            if len(batch) >= batch_size:
+                VendorPerformance.objects.bulk_update(batch, fields)
+                updated += len(batch)
+                batch = []
+
+        if batch:
+            VendorPerformance.objects.bulk_update(batch, fields)
+            updated += len(batch)
+
+        if vendor_ids is None:
+            vendor_ids = queryset.values_list('vendor_id', flat=True)
+        VendorPerformance.invalidate_cached_metrics(vendor_ids)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Recomputed performance of {updated} vendors '
+                f'in {elapsed:.2f} seconds.'
+            )
+        )
@@ -0,0 +1,57 @@
+"""
+    Command to apply queued vendor performance events.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from order.models import PerformanceEvent
+
+
+class Command(BaseCommand):
+    """
+        Drain the PerformanceEvent queue in batches and
+        apply them to the vendor performance data.
+        Used when VENDOR_METRICS_MODE is "async".
+    """
+    help = 'Apply queued vendor performance events.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of events applied per transaction.'
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=1.0,
+            help='Seconds to wait when the queue is empty.'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when the queue is empty.'
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+
+        try:
+            while True:
+                processed = PerformanceEvent.objects.process_batch(
+                    options['batch_size']
+                )
+                total += processed
+
+                if not processed:
+                    if options['once']:
+                        break
+                    time.sleep(options['sleep'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Processed {total} events.')
+        )
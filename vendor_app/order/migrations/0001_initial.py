@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-18 10:57
+
+import django.core.validators
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PerformanceEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('purchase_order_id', models.BigIntegerField()),
+                ('event_type', models.CharField(choices=[('issued', 'Issued'), ('acknowledged', 'Acknowledged'), ('completed', 'Completed')], max_length=20)),
+                ('occurred_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('response_time', models.DurationField(blank=True, null=True)),
+                ('on_time', models.BooleanField(blank=True, null=True)),
+                ('quality_rating', models.FloatField(blank=True, null=True)),
+                ('weight', models.SmallIntegerField(default=1)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PurchaseOrder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('po_number', models.CharField(max_length=100, unique=True)),
+                ('order_date', models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ('delivery_date', models.DateTimeField(blank=True, null=True)),
+                ('items', models.JSONField()),
+                ('quantity', models.IntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)])),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('out-to-deliver', 'Out-to-deliver'), ('completed', 'Completed'), ('canceled', 'Canceled')], default='pending', max_length=30)),
+                ('quality_rating', models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(10.0)])),
+                ('acknowledgment_date', models.DateTimeField(blank=True, null=True)),
+                ('date_delivered', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.7 on 2026-10-18 10:57
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('order', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='purchaseorder',
+            name='vendor',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='performanceevent',
+            name='vendor',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='purchaseorder',
+            index=models.Index(fields=['vendor', 'acknowledgment_date'], name='po_vendor_ack_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='purchaseorder',
+            index=models.Index(fields=['vendor', 'status', 'date_delivered'], name='po_vendor_status_delivered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='purchaseorder',
+            index=models.Index(fields=['order_date', 'id'], name='po_order_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='purchaseorder',
+            index=models.Index(fields=['vendor', 'order_date', 'id'], name='po_vendor_order_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='purchaseorder',
+            index=models.Index(fields=['status', 'delivery_date'], name='po_status_delivery_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='performanceevent',
+            constraint=models.UniqueConstraint(fields=('purchase_order_id', 'event_type', 'weight'), name='unique_performance_event'),
+        ),
+    ]
@@ -2,19 +2,25 @@
     Models to manage orders.
 """
 
-from django.db import models
-from django.core.cache import cache
-from django.db.models import Avg
+from django.db import (
+    models,
+    transaction
+)
 from django.db.models import (
     F,
+    Q,
+    Count,
     DurationField,
     ExpressionWrapper,
-    Sum,
-    Count
+    Sum
 )
+from django.db.models.functions import TruncDate
+from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
+import copy
 from django.db.models.signals import (
+    post_delete,
     post_save,
     pre_save
 )
@@ -28,6 +34,135 @@ from django.core.validators import (
 from vendor.models import VendorPerformance
 
 
+# Time given to a vendor to deliver a purchase order.
+DELIVERY_PERIOD = timedelta(days=10)
+
+
+def _copy_value(value):
+    """
+        Copy mutable field values (JSON) so in place
+        changes are seen as changes.
+    """
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+class PurchaseOrderManager(models.Manager):
+    """
+        Manager for purchase orders.
+    """
+
+    def bulk_ingest(self, rows, batch_size=1000):
+        """
+            Insert many purchase orders with bulk_create in
+            chunks and apply the vendor performance changes
+            once per vendor and day instead of once per order.
+
+            bulk_create does not send the save signals, so
+            the fields set by them are filled in here when
+            the rows do not have them, and the transitions
+            recorded in the rows (issue, acknowledgment,
+            delivery) are applied to the rollups of the
+            days they happened.
+
+        Args:
+            rows (type = list of dict) validated purchase order data.
+            batch_size (type = int) rows inserted per query.
+        Returns:
+            list of created PurchaseOrder instances.
+        """
+        now = timezone.now()
+        orders = []
+        for row in rows:
+            # Orders are due a delivery period after they were placed.
+            order_date = row.get('order_date', now)
+            orders.append(self.model(**{
+                'order_date': order_date,
+                'delivery_date': order_date + DELIVERY_PERIOD,
+                **row
+            }))
+
+        with transaction.atomic():
+            orders = self.bulk_create(orders, batch_size=batch_size)
+
+            days = {}
+            for order in orders:
+                add_deltas_by_day(days, order, recorded_deltas(order))
+
+            for (vendor_id, day), deltas in sorted(days.items()):
+                VendorPerformance.apply_deltas(vendor_id, day=day, **deltas)
+
+        return orders
+
+    def performance_counters(self, vendor_ids=None, by_day=False):
+        """
+            Compute the vendor performance counters with
+            GROUP BY vendor queries. Each query is served
+            by one of the vendor indexes of PurchaseOrder,
+            so limiting it to some vendors reads only their
+            purchase orders.
+
+        Args:
+            vendor_ids (type = list/None) limit to these vendors.
+            by_day (type = boolean) group by day of the
+            lifecycle transition as well.
+        Returns:
+            dict of vendor id (or vendor id and day when
+            by_day is set) to dict of counters.
+        """
+        queryset = self.all()
+        if vendor_ids is not None:
+            queryset = queryset.filter(vendor_id__in=vendor_ids)
+
+        def grouped(queryset, date_field):
+            if not by_day:
+                return queryset.values('vendor')
+            return queryset.annotate(
+                day=TruncDate(date_field)
+            ).values('vendor', 'day')
+
+        response_time = ExpressionWrapper(
+            F('acknowledgment_date') - F('order_date'),
+            output_field=DurationField()
+        )
+
+        queries = [
+            grouped(queryset, 'order_date').annotate(
+                po_issued=Count('id'),
+            ),
+            grouped(
+                queryset.filter(status='completed'),
+                'date_delivered'
+            ).annotate(
+                po_delivered=Count('id'),
+                po_delivered_on_time=Count(
+                    'id',
+                    filter=Q(date_delivered__lte=F('delivery_date'))
+                ),
+                quality_rating_total=Sum('quality_rating'),
+                quality_rating_count=Count('quality_rating'),
+            ),
+            grouped(
+                queryset.filter(acknowledgment_date__isnull=False),
+                'acknowledgment_date'
+            ).annotate(
+                res_time_total=Sum(response_time),
+                res_count=Count('id'),
+            ),
+        ]
+
+        counters = {}
+        for query in queries:
+            for row in query.order_by():
+                key = row.pop('vendor')
+                if by_day:
+                    key = (key, row.pop('day'))
+                counters.setdefault(key, {}).update(row)
+
+        return counters
+
+
 class PurchaseOrder(models.Model):
     """
         Model to create vendor instance.
@@ -41,9 +176,13 @@ class PurchaseOrder(models.Model):
     po_number = models.CharField(max_length=100, unique=True)
     vendor = models.ForeignKey(
         get_user_model(),
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        # Covered by the composite indexes below.
+        db_index=False
     )
-    order_date = models.DateTimeField(auto_now_add=True)
+    # Set on creation like auto_now_add, which bulk_create would
+    # also apply to the dates of imported orders.
+    order_date = models.DateTimeField(default=timezone.now, editable=False)
     delivery_date = models.DateTimeField(null=True, blank=True)
     items = models.JSONField()
     quantity = models.IntegerField(
@@ -68,35 +207,274 @@ class PurchaseOrder(models.Model):
     acknowledgment_date = models.DateTimeField(null=True, blank=True)
     date_delivered = models.DateTimeField(null=True, blank=True)
 
+    objects = PurchaseOrderManager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['vendor', 'acknowledgment_date'],
+                name='po_vendor_ack_idx'
+            ),
+            models.Index(
+                fields=['vendor', 'status', 'date_delivered'],
+                name='po_vendor_status_delivered_idx'
+            ),
+            models.Index(
+                fields=['order_date', 'id'],
+                name='po_order_date_idx'
+            ),
+            # Filtered lists, in the order of their pages.
+            models.Index(
+                fields=['vendor', 'order_date', 'id'],
+                name='po_vendor_order_date_idx'
+            ),
+            models.Index(
+                fields=['status', 'delivery_date'],
+                name='po_status_delivery_idx'
+            ),
+        ]
+
     def __str__(self):
         return f"PO: {self.po_number} Vendor: {self.vendor.name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+            Keep a snapshot of the values loaded from
+            the database to find out what changed.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: _copy_value(value)
+            for name, value in zip(field_names, values)
+            if value is not models.DEFERRED
+        }
+        return instance
+
+    def _snapshot(self):
+        """
+            Take the current values as the loaded values.
+        """
+        self._loaded_values = {
+            field.attname: _copy_value(getattr(self, field.attname))
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+    def loaded_value(self, name):
+        """
+            Return the value of a field as it is stored in
+            the database. Values not loaded with the instance
+            are fetched once.
+
+        Args:
+            name (type = str) attname of the field.
+        """
+        loaded = self.__dict__.setdefault('_loaded_values', {})
+        if name not in loaded:
+            loaded[name] = PurchaseOrder.objects.filter(
+                pk=self.pk
+            ).values_list(name, flat=True).first()
+
+        return loaded[name]
+
+    def changed_fields(self):
+        """
+            Return the attnames of the fields whose value
+            differs from the loaded one.
+        """
+        loaded = getattr(self, '_loaded_values', {})
+        return {
+            name for name, value in loaded.items()
+            if getattr(self, name) != value
+        }
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._snapshot()
 
-def update_cache(cached_data, data):
+    def save(self, *args, **kwargs):
+        """
+            Save the purchase order and the vendor performance
+            counters updated by its signals in one transaction.
+        """
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+        self._snapshot()
+
+
+class PerformanceEventManager(models.Manager):
+    """
+        Manager for queued performance events.
     """
-        This function is meant to update
-        data in cache.
 
-    Args:
-        cached_data(type = dict/None)
-        data (type = dict)
-    Returns:
-        cached_data(type = dict)
+    def enqueue(self, instance, deltas, weight=1):
+        """
+            Queue the vendor performance changes caused by
+            a save of a purchase order as one event per
+            lifecycle transition.
+
+        Args:
+            instance (type = PurchaseOrder instance)
+            deltas (type = dict) counter deltas of the save.
+            weight (type = int) 1, or -1 with the negated
+            deltas of a deleted purchase order.
+        """
+        events = []
+        common = {
+            'vendor_id': instance.vendor_id,
+            'purchase_order_id': instance.id,
+            'weight': weight,
+        }
+
+        if 'po_issued' in deltas:
+            events.append(self.model(
+                event_type=PerformanceEvent.ISSUED,
+                occurred_at=instance.order_date,
+                **common
+            ))
+        if 'res_count' in deltas:
+            events.append(self.model(
+                event_type=PerformanceEvent.ACKNOWLEDGED,
+                occurred_at=instance.acknowledgment_date,
+                response_time=deltas['res_time_total'],
+                **common
+            ))
+        if 'po_delivered' in deltas:
+            on_time = deltas.get('po_delivered_on_time')
+            events.append(self.model(
+                event_type=PerformanceEvent.COMPLETED,
+                occurred_at=instance.date_delivered,
+                on_time=None if on_time is None else bool(on_time),
+                quality_rating=deltas.get('quality_rating_total'),
+                **common
+            ))
+
+        # A transition queued twice is only applied once.
+        self.bulk_create(events, ignore_conflicts=True)
+
+    def process_batch(self, batch_size=500):
+        """
+            Apply a batch of queued events to the vendor
+            performance counters, coalesced per vendor and
+            day, and remove them in the same transaction.
+
+            A failure rolls back both the counters and the
+            removal, so every event is applied exactly once
+            even when the batch is retried.
+
+        Args:
+            batch_size (type = int) events handled at once.
+        Returns:
+            int number of processed events.
+        """
+        completed = Q(event_type=PerformanceEvent.COMPLETED)
+
+        with transaction.atomic():
+            ids = list(
+                self.select_for_update(skip_locked=True)
+                .order_by('id')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                return 0
+
+            rows = self.filter(id__in=ids).annotate(
+                day=TruncDate('occurred_at')
+            ).values('vendor', 'day').annotate(
+                po_issued=Sum(
+                    'weight',
+                    filter=Q(event_type=PerformanceEvent.ISSUED)
+                ),
+                po_delivered=Sum('weight', filter=completed),
+                po_delivered_on_time=Sum(
+                    'weight',
+                    filter=completed & Q(on_time=True)
+                ),
+                quality_rating_total=Sum('quality_rating'),
+                quality_rating_count=Sum(
+                    'weight',
+                    filter=Q(quality_rating__isnull=False)
+                ),
+                res_time_total=Sum('response_time'),
+                res_count=Sum(
+                    'weight',
+                    filter=Q(response_time__isnull=False)
+                ),
+            ).order_by()
+
+            for row in rows:
+                vendor_id = row.pop('vendor')
+                day = row.pop('day')
+                deltas = {
+                    field: value for field, value in row.items()
+                    if value
+                }
+                if deltas:
+                    VendorPerformance.apply_deltas(
+                        vendor_id,
+                        day=day,
+                        **deltas
+                    )
+
+            self.filter(id__in=ids).delete()
+
+        return len(ids)
+
+
+class PerformanceEvent(models.Model):
     """
-    try:
-        cached_data.update(data)
-    except AttributeError:
-        cached_data = data
+        Queued change of a vendor's performance caused
+        by a purchase order lifecycle transition.
+        Drained by the run_metrics_worker command.
 
-    return cached_data
+        Deleting a purchase order queues its transitions
+        again with a weight of -1 and negated values.
+    """
+    ISSUED = 'issued'
+    ACKNOWLEDGED = 'acknowledged'
+    COMPLETED = 'completed'
+    CHOICES = [
+        (ISSUED, 'Issued'),
+        (ACKNOWLEDGED, 'Acknowledged'),
+        (COMPLETED, 'Completed'),
+    ]
+    vendor = models.ForeignKey(
+        get_user_model(),
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    purchase_order_id = models.BigIntegerField()
+    event_type = models.CharField(max_length=20, choices=CHOICES)
+    occurred_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    response_time = models.DurationField(null=True, blank=True)
+    on_time = models.BooleanField(null=True, blank=True)
+    quality_rating = models.FloatField(null=True, blank=True)
+    weight = models.SmallIntegerField(default=1)
+
+    objects = PerformanceEventManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['purchase_order_id', 'event_type', 'weight'],
+                name='unique_performance_event'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} of PO {self.purchase_order_id}"
 
 
 @receiver(pre_save, sender=PurchaseOrder)
 def update_stats_pre_save(sender, instance, **kwargs):
     """
         This pre save signal function is meant to
-        update different statistical data's related
-        to vendor's performance.
+        collect the changes in vendor's performance
+        counters caused by the update of a purchase order.
+        They are applied by update_stats_post_save.
 
     Args:
         sender(type = model)
@@ -107,135 +485,42 @@ def update_stats_pre_save(sender, instance, **kwargs):
     """
 
     current_time = timezone.now()
+    instance._performance_deltas = {}
 
     # Set delivery date.
     if instance._state.adding:
-        date_in_10_days = current_time + timedelta(days=10)
-        instance.delivery_date = date_in_10_days
+        instance.delivery_date = current_time + DELIVERY_PERIOD
 
     # Check if updating.
-    if instance.id:
-        original_instance = PurchaseOrder.objects.get(id=instance.id)
+    if not instance._state.adding:
+        deltas = instance._performance_deltas
 
         # Set the date delivered the product.
         if (
-            original_instance.date_delivered is None and (
+            instance.loaded_value('date_delivered') is None and (
                 instance.status == 'completed'
             )
         ):
             instance.date_delivered = current_time
+            deltas['po_delivered'] = 1
 
-        # Set average response time.
-        if (original_instance.acknowledgment_date is None and
-                instance.acknowledgment_date is not None):
-
-            # Calculate the response time for the current instance
-            response_time = (
-                instance.acknowledgment_date - original_instance.order_date
-            )
-
-            # Find the performance instance of the vendor.
-            perf_ins = VendorPerformance.objects.filter(
-                vendor=instance.vendor
-            ).first()
-
-            # Access cached data.
-            cached_data = cache.get(instance.vendor.id)
-
-            # set expiration time
-            expire_in = 86400  # seconds (1 day)
-
-            if cached_data is None or (
-                'res_time_total' not in cached_data.keys() or (
-                    'res_count' not in cached_data.keys()
-                )
-            ):
-
-                # Expression used to calculate the response time of each po
-                expression = ExpressionWrapper(
-                    F('acknowledgment_date') - F('order_date'),
-                    output_field=DurationField()
-                )
-
-                """
-                    Find the sum of the response time of all purchase orders
-                    and count of total purchase orders vendor responded.
-                """
-                result = (
-                    PurchaseOrder.objects.annotate(
-                        difference=expression
-                    ).aggregate(
-                        total_resp_time=Sum('difference'),
-                        total_resp_count=Count(
-                            'id',
-                            filter=~models.Q(
-                                acknowledgment_date__isnull=True
-                            )
-                        )
-                    )
-                )
-
-                """
-                    Check the scenarios which can derive from
-                    presence or the absence of data. adjust data
-                    with what we get from db and what we have.
-                """
-                if result['total_resp_time'] is None:
-                    result['total_resp_time'] = response_time
-                    result['total_resp_count'] = 1
-
-                elif result['total_resp_time'] is not None:
-                    result['total_resp_time'] += response_time
-                    result['total_resp_count'] += 1
-
-                # Handle cache.
-                data = {
-                        'res_time_total': result['total_resp_time'],
-                        'res_count': result['total_resp_count']
-                    }
-                cached_data = update_cache(cached_data, data)
-
-                cache.set(
-                    instance.vendor.id,
-                    cached_data,
-                    timeout=expire_in
+            if instance.delivery_date is not None:
+                deltas['po_delivered_on_time'] = int(
+                    instance.delivery_date >= instance.date_delivered
                 )
 
-                # Retrieved updated cache.
-                cached_data = cache.get(instance.vendor.id)
-
-                # Update and save the average response time of the vendor.
-                perf_ins.average_response_time = (
-                    (cached_data['res_time_total']).days /
-                    cached_data['res_count']
-                )
-
-            else:
-                # Case of both cache and the respective keys are present.
-
-                # Update the data.
-                cached_data.update({
-                    'res_time_total': (
-                        cached_data['res_time_total'] + response_time
-                    ),
-                    'res_count': cached_data['res_count'] + 1
-                })
-
-                # Set cache.
-                cache.set(
-                    instance.vendor.id,
-                    cached_data,
-                    timeout=expire_in
-                )
+            if instance.quality_rating is not None:
+                deltas['quality_rating_total'] = instance.quality_rating
+                deltas['quality_rating_count'] = 1
 
-                # Update and save the average response time of the vendor.
-                perf_ins.average_response_time = (
-                    (cached_data['res_time_total']).days /
-                    cached_data['res_count']
-                )
-
-            # Save performance instance.
-            perf_ins.save()
+        # Set response time.
+        if (instance.loaded_value('acknowledgment_date') is None and
+                instance.acknowledgment_date is not None):
+            deltas['res_time_total'] = (
+                instance.acknowledgment_date -
+                instance.loaded_value('order_date')
+            )
+            deltas['res_count'] = 1
 
 
 @receiver(post_save, sender=PurchaseOrder)
@@ -245,6 +530,12 @@ def update_stats_post_save(sender, created, instance, **kwargs):
         update different statistical data's related
         to vendor's performance.
 
+        Counters are stored in VendorPerformance and
+        incremented atomically, so the rates never need
+        a scan of the purchase order table. With
+        VENDOR_METRICS_MODE set to "async" the changes
+        are queued as PerformanceEvent instead.
+
     Args:
         sender(type = model)
         created (type = boolean)
@@ -253,149 +544,149 @@ def update_stats_post_save(sender, created, instance, **kwargs):
     Returns:
         None
     """
-    # Access performance instance of the vendor.
-    perf_ins = VendorPerformance.objects.filter(
-                vendor=instance.vendor
-            ).first()
+    deltas = getattr(instance, '_performance_deltas', {})
+    instance._performance_deltas = {}
 
-    # Access cached data.
-    cached_data = cache.get(instance.vendor.id)
+    if created:
+        # Assuming that the po is directly forwarded
+        # to vendor at the time of creating.
+        deltas['po_issued'] = 1
 
-    # set expiration time
-    expire_in = 86400  # seconds (1 day)
+    if not deltas:
+        return
 
-    # Check and populate cache.
-    if cached_data is None or (
-        'po_delivered' not in cached_data.keys() or (
-            'po_issued' not in cached_data.keys()
-        )
-    ):
-        po_delivered = PurchaseOrder.objects.filter(
-            vendor=instance.vendor,
-            status='completed'
-        ).count()
-
-        po_issued = PurchaseOrder.objects.filter(
-            vendor=instance.vendor
-        ).count()
-
-        data = {
-                'po_delivered': po_delivered,
-                'po_issued': po_issued
-            }
-        cached_data = update_cache(cached_data, data)
-        cache.set(
-            instance.vendor.id,
-            cached_data,
-            timeout=expire_in
-        )
-        cached_data = cache.get(instance.vendor.id)
+    if getattr(settings, 'VENDOR_METRICS_MODE', 'sync') == 'async':
+        PerformanceEvent.objects.enqueue(instance, deltas)
+    else:
+        apply_deltas_by_day(instance, deltas)
 
-        # Update fulfillment rate.
-        perf_ins.fulfillment_rate = (
-            cached_data['po_delivered']/cached_data['po_issued']
-        )
 
-    elif created:
-        """
-            If cache is available and new po created.
+# Date field of the transition each counter is recorded at.
+TRANSITION_DATES = {
+    'po_issued': 'order_date',
+    'po_delivered': 'date_delivered',
+    'po_delivered_on_time': 'date_delivered',
+    'quality_rating_total': 'date_delivered',
+    'quality_rating_count': 'date_delivered',
+    'res_time_total': 'acknowledgment_date',
+    'res_count': 'acknowledgment_date',
+}
 
-            Update the number of po issued.
-            Assuming that the po is directly forwarded
-            to vendor at the time of creating.
-        """
-        data = {
-                'po_issued': cached_data['po_issued'] + 1
-            }
-        cached_data = update_cache(cached_data, data)
-        cache.set(
-            instance.vendor.id,
-            cached_data,
-            timeout=expire_in
-        )
-        cached_data = cache.get(instance.vendor.id)
 
-        # Update fulfillment rate.
-        perf_ins.fulfillment_rate = (
-            cached_data['po_delivered']/cached_data['po_issued']
-        )
+def add_deltas_by_day(days, instance, deltas):
+    """
+        Add the counter deltas of a purchase order to the
+        ones of its vendor on the day of each transition.
 
-    elif instance.status == 'completed':
-        # If cache is available and po instance is updated
-
-        # Update the number of po delivered.
-        data = {
-                'po_delivered': cached_data['po_delivered'] + 1
-            }
-        cached_data = update_cache(cached_data, data)
-        cache.set(
-            instance.vendor.id,
-            cached_data,
-            timeout=expire_in
-        )
-        cached_data = cache.get(instance.vendor.id)
+    Args:
+        days (type = dict) (vendor id, day) to dict of
+        counter field name to delta, updated in place.
+        instance (type = PurchaseOrder instance)
+        deltas (type = dict) counter field name to delta.
+    """
+    for field, value in deltas.items():
+        day = timezone.localdate(getattr(instance, TRANSITION_DATES[field]))
+        day_deltas = days.setdefault((instance.vendor_id, day), {})
+        if field in day_deltas:
+            value += day_deltas[field]
+        day_deltas[field] = value
 
-        # Update fulfillment rate.
-        perf_ins.fulfillment_rate = (
-            cached_data['po_delivered']/cached_data['po_issued']
-        )
-        # print(cached_data['po_delivered'])
-        # print(cached_data['po_issued'])
-        # print(perf_ins.fulfillment_rate)
 
+def apply_deltas_by_day(instance, deltas):
+    """
+        Apply the counter deltas of a purchase order, each
+        one to the daily rollup of the day of its
+        transition, like the queued events and
+        rebuild_performance_history do.
+
+    Args:
+        instance (type = PurchaseOrder instance)
+        deltas (type = dict) counter field name to delta.
+    """
+    days = {}
+    add_deltas_by_day(days, instance, deltas)
+
+    for (vendor_id, day), day_deltas in sorted(days.items()):
+        VendorPerformance.apply_deltas(vendor_id, day=day, **day_deltas)
+
+
+def recorded_deltas(instance):
+    """
+        Return the counter deltas of the lifecycle
+        transitions recorded for a purchase order.
+
+    Args:
+        instance (type = PurchaseOrder instance)
+    Returns:
+        dict of counter field name to delta.
+    """
+    deltas = {'po_issued': 1}
+
+    if instance.status == 'completed' and instance.date_delivered:
+        deltas['po_delivered'] = 1
         if instance.delivery_date is not None:
+            deltas['po_delivered_on_time'] = int(
+                instance.delivery_date >= instance.date_delivered
+            )
+        if instance.quality_rating is not None:
+            deltas['quality_rating_total'] = instance.quality_rating
+            deltas['quality_rating_count'] = 1
 
-            # Set quality rating average.
-            if (instance.quality_rating is not None and
-                    instance.quality_rating > 0):
-                quality_rating_avg = PurchaseOrder.objects.filter(
-                    vendor=instance.vendor,
-                    status='completed'
-                ).aggregate(avg_rating=Avg('quality_rating'))
-                perf_ins.quality_rating_avg = quality_rating_avg['avg_rating']
-
-            # Calculate on time delivery rate.
-            cached_data = cache.get(instance.vendor.id)
-
-            current_time = timezone.now()
-            if instance.delivery_date >= current_time:
-
-                if 'po_delivered_on_time' in cached_data.keys():
-                    data = {
-                            'po_delivered_on_time': (
-                                cached_data['po_delivered_on_time'] + 1
-                            )
-                        }
-                    cached_data = update_cache(cached_data, data)
-                    cache.set(
-                        instance.vendor.id,
-                        cached_data,
-                        timeout=expire_in
-                    )
-                    cached_data = cache.get(instance.vendor.id)
-                    perf_ins.on_time_delivery_rate = (
-                        cached_data['po_delivered_on_time'] /
-                        cached_data['po_delivered']
-                    )
-                else:
-                    po_delivered_on_time = PurchaseOrder.objects.filter(
-                        delivery_date__gt=F('date_delivered')
-                    ).count()
-
-                    data = {
-                            'po_delivered_on_time': po_delivered_on_time
-                        }
-                    cached_data = update_cache(cached_data, data)
-                    cache.set(
-                        instance.vendor.id,
-                        cached_data,
-                        timeout=expire_in
-                    )
-                    cached_data = cache.get(instance.vendor.id)
-                    perf_ins.on_time_delivery_rate = (
-                        cached_data['po_delivered_on_time'] /
-                        cached_data['po_delivered']
-                    )
+    if instance.acknowledgment_date is not None:
+        deltas['res_time_total'] = (
+            instance.acknowledgment_date - instance.order_date
+        )
+        deltas['res_count'] = 1
+
+    return deltas
+
+
+def removal_deltas(instance):
+    """
+        Return the negated counter deltas of the lifecycle
+        transitions recorded for a purchase order.
+
+    Args:
+        instance (type = PurchaseOrder instance)
+    Returns:
+        dict of counter field name to delta.
+    """
+    return {
+        field: -value
+        for field, value in recorded_deltas(instance).items()
+    }
+
+
+@receiver(post_delete, sender=PurchaseOrder)
+def update_stats_post_delete(sender, instance, origin=None, **kwargs):
+    """
+        This post delete signal function is meant to
+        remove the transitions of a deleted purchase
+        order from the vendor's performance counters and
+        from the daily rollups of the days they were
+        recorded at.
+
+        Orders deleted along with their vendor are
+        skipped, its performance data goes as well.
+
+    Args:
+        sender(type = model)
+        instance (type = model instance) deleted.
+        origin (type = model instance or queryset) the
+        delete was started from.
+        **kwargs (type = key word arguments)
+    Returns:
+        None
+    """
+    if origin is not None and getattr(
+        origin, 'model', type(origin)
+    ) is not PurchaseOrder:
+        return
+
+    deltas = removal_deltas(instance)
+
+    if getattr(settings, 'VENDOR_METRICS_MODE', 'sync') == 'async':
+        PerformanceEvent.objects.enqueue(instance, deltas, weight=-1)
+        return
 
-    # Save the performance instance with changes.
-    perf_ins.save()
+    apply_deltas_by_day(instance, deltas)
@@ -0,0 +1,42 @@
+"""
+    Pagination of purchase order lists.
+"""
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+
+from vendor.pagination import KeysetPagination
+
+
+class PurchaseOrderPagination(KeysetPagination):
+    """
+        Keyset pagination of purchase orders, oldest first.
+        Pages are read from the (order_date, id) index, so
+        deep pages and orders sharing an order date cost
+        the same as the first page.
+    """
+    ordering = ('order_date', 'id')
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    def decode_position(self, position):
+        """
+            Return the (order_date, id) key of a cursor position.
+        """
+        try:
+            order_date, pk = position.rsplit(',', 1)
+            order_date = parse_datetime(order_date)
+            if order_date is None:
+                raise ValueError(position)
+            return order_date, int(pk)
+        except (AttributeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _get_position_from_instance(self, instance, ordering):
+        # The list is served from model instances or values() rows.
+        if isinstance(instance, dict):
+            order_date, pk = instance['order_date'], instance['id']
+        else:
+            order_date, pk = instance.order_date, instance.id
+        return f'{order_date.isoformat()},{pk}'
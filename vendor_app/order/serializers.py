@@ -2,13 +2,24 @@
     Serializer to manage Puchase orders.
 """
 
+from django.contrib.auth import get_user_model
+from django.utils import timezone
 from rest_framework import serializers
+from vendor.mixins import SparseFieldsetMixin
+
 from .models import PurchaseOrder
+from .export import FORMATS
 
 
-class PurchaseOrderSerializer(serializers.ModelSerializer):
+class PurchaseOrderSerializer(
+    SparseFieldsetMixin,
+    serializers.ModelSerializer
+):
     """
         Serialize and validate Purchase order.
+
+        GET responses render only the fields asked for
+        with ?fields= or without the ones in ?exclude=.
     """
 
     class Meta:
@@ -40,3 +51,152 @@ class PO_CompleteSerializer(serializers.ModelSerializer):
     class Meta:
         model = PurchaseOrder
         fields = ['quality_rating']
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    """
+        Validate query parameters of the purchase order export.
+    """
+    file_format = serializers.ChoiceField(
+        choices=list(FORMATS),
+        default='csv'
+    )
+
+
+class ImportVendorField(serializers.PrimaryKeyRelatedField):
+    """
+        Vendor of an imported row. Vendors are kept in the
+        "vendors" dict of the context, so an import reads
+        each vendor once instead of once per row.
+    """
+
+    def to_internal_value(self, data):
+        vendors = self.context.get('vendors')
+        if vendors is None:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+        if pk not in vendors:
+            vendors[pk] = self.get_queryset().filter(pk=pk).first()
+        if vendors[pk] is None:
+            self.fail('does_not_exist', pk_value=data)
+        return vendors[pk]
+
+
+class PurchaseOrderImportSerializer(PurchaseOrderSerializer):
+    """
+        Validate a row of a purchase order import.
+
+        Unlike the API, rows keep the dates, status and
+        rating of an export, so a completed order is
+        imported back as completed. They must describe an
+        order the API could have produced.
+
+        po_number uniqueness is checked by the import for
+        each batch with one query, not for each row.
+    """
+    vendor = ImportVendorField(queryset=get_user_model().objects.all())
+    order_date = serializers.DateTimeField(required=False)
+
+    class Meta(PurchaseOrderSerializer.Meta):
+        extra_kwargs = {
+            'po_number': {
+                'validators': []
+            },
+        }
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        order_date = attrs.get('order_date') or timezone.now()
+        completed = attrs.get('status') == 'completed'
+
+        errors = {}
+        if completed and attrs.get('date_delivered') is None:
+            errors['date_delivered'] = ['Required for completed orders.']
+        for field in ['date_delivered', 'quality_rating']:
+            if not completed and attrs.get(field) is not None:
+                errors[field] = ['Only completed orders have this value.']
+        for field in ['acknowledgment_date', 'date_delivered']:
+            if attrs.get(field) is not None and attrs[field] < order_date:
+                errors.setdefault(field, []).append(
+                    'Earlier than the order date.'
+                )
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
+
+class BulkPurchaseOrderListSerializer(serializers.ListSerializer):
+    """
+        Validate the list of a bulk creation. po_number
+        uniqueness is checked with one query per batch of
+        rows instead of one query per row.
+    """
+    batch_size = 1000
+
+    def to_internal_value(self, data):
+        rows = super().to_internal_value(data)
+
+        existing = set()
+        for start in range(0, len(rows), self.batch_size):
+            existing.update(
+                PurchaseOrder.objects.filter(po_number__in=[
+                    row['po_number']
+                    for row in rows[start:start + self.batch_size]
+                ]).values_list('po_number', flat=True)
+            )
+
+        errors = []
+        seen = set()
+        for row in rows:
+            if row['po_number'] in existing:
+                errors.append({'po_number': [
+                    'purchase order with this po number already exists.'
+                ]})
+            elif row['po_number'] in seen:
+                errors.append({'po_number': ['Duplicate po_number.']})
+            else:
+                errors.append({})
+            seen.add(row['po_number'])
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return rows
+
+
+class BulkPurchaseOrderSerializer(PurchaseOrderSerializer):
+    """
+        Validate a purchase order of a bulk creation.
+
+        Vendors are read once per request with
+        ImportVendorField, po_number uniqueness is checked
+        by BulkPurchaseOrderListSerializer.
+    """
+    vendor = ImportVendorField(queryset=get_user_model().objects.all())
+
+    class Meta(PurchaseOrderSerializer.Meta):
+        list_serializer_class = BulkPurchaseOrderListSerializer
+        extra_kwargs = {
+            **PurchaseOrderSerializer.Meta.extra_kwargs,
+            'po_number': {
+                'validators': []
+            },
+        }
+
+
+class ImportFileSerializer(serializers.Serializer):
+    """
+        Validate the upload of a purchase order import.
+    """
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(
+        choices=list(FORMATS),
+        default='csv'
+    )
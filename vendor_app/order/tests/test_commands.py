@@ -0,0 +1,713 @@
+"""
+    Unit tests for management commands.
+"""
+import json
+import os
+import tempfile
+from io import StringIO
+from datetime import timedelta
+
+from django.test import (
+    TestCase,
+    override_settings
+)
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.utils import timezone
+
+from order.models import (
+    PurchaseOrder,
+    PerformanceEvent
+)
+from vendor.models import (
+    VendorPerformance,
+    DailyVendorPerformance
+)
+
+
+class RecomputeVendorPerformanceTest(TestCase):
+    """
+        Unit test for recompute_vendor_performance command.
+    """
+
+    def setUp(self):
+        """
+            Set up data for testing.
+        """
+        self.vendors = [
+            get_user_model().objects.create_vendor(
+                email=f'testvendor{number}@example.com',
+                name=f'test Vendor {number}',
+                password='testpass123',
+                vendor_data={
+                    "contact_details": "contact me here",
+                    "address": "test address, street one, india",
+                    "vendor_code": f"8765432{number}"
+                }
+            )
+            for number in range(2)
+        ]
+
+        for vendor in self.vendors:
+            for number in range(4):
+                PurchaseOrder.objects.create(
+                    po_number=f"test-{vendor.id}-{number}-po",
+                    items={"testProp1": "test_string"},
+                    quantity=5,
+                    vendor=vendor
+                )
+
+        # Acknowledge and complete two orders of the first vendor.
+        orders = PurchaseOrder.objects.filter(
+            vendor=self.vendors[0]
+        ).order_by('id')
+        for order, rating in zip(orders[:2], [6, 8]):
+            order.acknowledgment_date = order.order_date + timedelta(days=2)
+            order.save()
+            order.status = 'completed'
+            order.quality_rating = rating
+            order.save()
+
+        # Late delivery for one of the acknowledged orders.
+        late = orders[0]
+        late.date_delivered = late.delivery_date + timedelta(days=1)
+        late.save()
+
+        self.expected = {
+            perf_ins.vendor_id: perf_ins
+            for perf_ins in VendorPerformance.objects.all()
+        }
+        # Late delivery was set after completion.
+        self.expected[self.vendors[0].id].po_delivered_on_time = 1
+        self.expected[self.vendors[0].id].compute_rates()
+
+        # Throw away the incrementally maintained values.
+        VendorPerformance.objects.update(
+            po_issued=0,
+            po_delivered=0,
+            po_delivered_on_time=0,
+            fulfillment_rate=None,
+            on_time_delivery_rate=None,
+            res_count=0,
+            quality_rating_count=0,
+            quality_rating_total=0,
+            res_time_total=timedelta(),
+            average_response_time=None,
+            quality_rating_avg=None,
+        )
+
+    def assert_recomputed(self, vendor):
+        """
+            Compare a performance instance with the
+            incrementally maintained one.
+        """
+        perf_ins = VendorPerformance.objects.get(vendor=vendor)
+        expected = self.expected[vendor.id]
+
+        for field in (
+            VendorPerformance.COUNTER_FIELDS +
+            VendorPerformance.RATE_FIELDS
+        ):
+            self.assertEqual(
+                getattr(perf_ins, field),
+                getattr(expected, field),
+                field
+            )
+
+    def test_recompute_all_vendors(self):
+        """
+            Test every vendor is rebuilt from purchase orders.
+        """
+        out = StringIO()
+        call_command(
+            'recompute_vendor_performance',
+            '--batch-size', '1',
+            stdout=out
+        )
+
+        self.assertIn('Recomputed performance of 2 vendors', out.getvalue())
+        for vendor in self.vendors:
+            self.assert_recomputed(vendor)
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendors[0])
+        self.assertEqual(perf_ins.fulfillment_rate, 0.5)
+        self.assertEqual(perf_ins.on_time_delivery_rate, 0.5)
+        self.assertEqual(perf_ins.quality_rating_avg, 7.0)
+        self.assertEqual(perf_ins.average_response_time, 2.0)
+
+    def test_recompute_single_vendor(self):
+        """
+            Test --vendor limits the rebuild.
+        """
+        call_command(
+            'recompute_vendor_performance',
+            '--vendor', str(self.vendors[1].id),
+            stdout=StringIO()
+        )
+
+        self.assert_recomputed(self.vendors[1])
+        self.assertEqual(
+            VendorPerformance.objects.get(vendor=self.vendors[0]).po_issued,
+            0
+        )
+
+    def test_recompute_with_no_orders(self):
+        """
+            Test vendors without orders are reset.
+        """
+        # Deleting orders removes them from consistent counters.
+        call_command('recompute_vendor_performance', stdout=StringIO())
+        PurchaseOrder.objects.all().delete()
+        VendorPerformance.objects.update(po_issued=3)
+
+        call_command('recompute_vendor_performance', stdout=StringIO())
+
+        for perf_ins in VendorPerformance.objects.all():
+            self.assertEqual(perf_ins.po_issued, 0)
+            self.assertIsNone(perf_ins.fulfillment_rate)
+            self.assertEqual(perf_ins.res_time_total, timedelta())
+
+
+@override_settings(VENDOR_METRICS_MODE='async')
+class RunMetricsWorkerTest(TestCase):
+    """
+        Unit test for run_metrics_worker command.
+    """
+
+    def setUp(self):
+        """
+            Set up data for testing.
+        """
+        self.vendor = get_user_model().objects.create_vendor(
+            email='testvendor@example.com',
+            name='test Vendor',
+            password='testpass123',
+            vendor_data={
+                "contact_details": "contact me here",
+                "address": "test address, street one, india",
+                "vendor_code": "87654321"
+            }
+        )
+
+        self.orders = [
+            PurchaseOrder.objects.create(
+                po_number=f"test-{number}-po",
+                items={"testProp1": "test_string"},
+                quantity=5,
+                vendor=self.vendor
+            )
+            for number in range(3)
+        ]
+        for order in self.orders[:2]:
+            order.acknowledgment_date = order.order_date + timedelta(days=4)
+            order.save()
+        self.orders[0].status = 'completed'
+        self.orders[0].quality_rating = 7
+        self.orders[0].save()
+
+    def test_saves_only_queue_events(self):
+        """
+            Test saves do not touch the performance data.
+        """
+        self.assertEqual(PerformanceEvent.objects.count(), 6)
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(perf_ins.po_issued, 0)
+        self.assertIsNone(perf_ins.fulfillment_rate)
+
+    def test_worker_applies_events(self):
+        """
+            Test the worker drains the queue and applies
+            the coalesced changes.
+        """
+        out = StringIO()
+        call_command(
+            'run_metrics_worker',
+            '--once',
+            '--batch-size', '4',
+            stdout=out
+        )
+
+        self.assertIn('Processed 6 events.', out.getvalue())
+        self.assertFalse(PerformanceEvent.objects.exists())
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(perf_ins.po_issued, 3)
+        self.assertEqual(perf_ins.po_delivered, 1)
+        self.assertEqual(perf_ins.po_delivered_on_time, 1)
+        self.assertEqual(perf_ins.res_count, 2)
+        self.assertEqual(perf_ins.average_response_time, 4.0)
+        self.assertEqual(perf_ins.quality_rating_avg, 7.0)
+        self.assertAlmostEqual(perf_ins.fulfillment_rate, 1 / 3)
+
+        # Running again has nothing left to apply.
+        call_command('run_metrics_worker', '--once', stdout=StringIO())
+        perf_ins.refresh_from_db()
+        self.assertEqual(perf_ins.po_issued, 3)
+
+    def test_worker_applies_deletions(self):
+        """
+            Test a deleted order is queued as negated events,
+            also when its own events were not applied yet.
+        """
+        # Events of the third order are still queued.
+        self.orders[2].delete()
+        call_command('run_metrics_worker', '--once', stdout=StringIO())
+
+        self.orders[0].delete()
+        self.assertEqual(PerformanceEvent.objects.count(), 3)
+        call_command('run_metrics_worker', '--once', stdout=StringIO())
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(perf_ins.po_issued, 1)
+        self.assertEqual(perf_ins.po_delivered, 0)
+        self.assertEqual(perf_ins.po_delivered_on_time, 0)
+        self.assertEqual(perf_ins.quality_rating_count, 0)
+        self.assertEqual(perf_ins.res_count, 1)
+        self.assertEqual(perf_ins.average_response_time, 4.0)
+        self.assertEqual(perf_ins.fulfillment_rate, 0.0)
+
+    def test_duplicate_event_is_applied_once(self):
+        """
+            Test a transition queued twice is counted once.
+        """
+        PerformanceEvent.objects.enqueue(
+            self.orders[2], {'po_issued': 1}
+        )
+        call_command('run_metrics_worker', '--once', stdout=StringIO())
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(perf_ins.po_issued, 3)
+
+
+class RebuildPerformanceHistoryTest(TestCase):
+    """
+        Unit test for rebuild_performance_history command.
+    """
+
+    def setUp(self):
+        """
+            Set up data for testing.
+        """
+        self.vendor = get_user_model().objects.create_vendor(
+            email='testvendor@example.com',
+            name='test Vendor',
+            password='testpass123',
+            vendor_data={
+                "contact_details": "contact me here",
+                "address": "test address, street one, india",
+                "vendor_code": "87654321"
+            }
+        )
+
+        for number in range(3):
+            order = PurchaseOrder.objects.create(
+                po_number=f"test-{number}-po",
+                items={"testProp1": "test_string"},
+                quantity=5,
+                vendor=self.vendor
+            )
+        order.acknowledgment_date = timezone.now()
+        order.save()
+        order.status = 'completed'
+        order.quality_rating = 5
+        order.save()
+
+        # Move the first order to an earlier day.
+        PurchaseOrder.objects.filter(po_number='test-0-po').update(
+            order_date=F('order_date') - timedelta(days=3)
+        )
+
+    def test_rebuild(self):
+        """
+            Test rollups are rebuilt per day of each transition.
+        """
+        today = timezone.localdate()
+
+        # Maintained incrementally by the signals.
+        rollup = DailyVendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(rollup.day, today)
+        self.assertEqual(rollup.po_issued, 3)
+
+        out = StringIO()
+        call_command('rebuild_performance_history', stdout=out)
+        self.assertIn('Rebuilt 2 daily rollups', out.getvalue())
+
+        earlier = DailyVendorPerformance.objects.get(
+            vendor=self.vendor,
+            day=today - timedelta(days=3)
+        )
+        self.assertEqual(earlier.po_issued, 1)
+        self.assertEqual(earlier.po_delivered, 0)
+
+        rollup = DailyVendorPerformance.objects.get(
+            vendor=self.vendor,
+            day=today
+        )
+        self.assertEqual(rollup.po_issued, 2)
+        self.assertEqual(rollup.po_delivered, 1)
+        self.assertEqual(rollup.quality_rating_total, 5)
+        self.assertEqual(rollup.res_count, 1)
+
+
+class BenchmarkListSerializationTest(TestCase):
+    """
+        Unit test for benchmark_list_serialization command.
+    """
+
+    def setUp(self):
+        """
+            Set up data for testing.
+        """
+        self.vendor = get_user_model().objects.create_vendor(
+            email='testvendor@example.com',
+            name='test Vendor',
+            password='testpass123',
+            vendor_data={"vendor_code": "87654320"}
+        )
+
+    def test_benchmark(self):
+        """
+            Test the command reports both paths and
+            removes the rows it added.
+        """
+        out = StringIO()
+        call_command(
+            'benchmark_list_serialization',
+            rows=20,
+            repeat=1,
+            stdout=out
+        )
+
+        self.assertIn('purchase orders: 20 rows', out.getvalue())
+        self.assertIn('vendors: 1 rows', out.getvalue())
+        self.assertFalse(PurchaseOrder.objects.exists())
+        self.assertEqual(
+            VendorPerformance.objects.get(vendor=self.vendor).po_issued,
+            0
+        )
+
+
+class BenchmarkJSONRenderersTest(TestCase):
+    """
+        Unit test for benchmark_json_renderers command.
+    """
+
+    def test_benchmark(self):
+        """
+            Test the command reports rendering and parsing.
+        """
+        out = StringIO()
+        call_command(
+            'benchmark_json_renderers',
+            rows=20,
+            repeat=1,
+            stdout=out
+        )
+
+        self.assertIn('render: ', out.getvalue())
+        self.assertIn('parse: ', out.getvalue())
+
+
+class ExportPurchaseOrdersTest(TestCase):
+    """
+        Unit test for export_purchase_orders command.
+    """
+
+    def setUp(self):
+        """
+            Set up data for testing.
+        """
+        self.vendors = [
+            get_user_model().objects.create_vendor(
+                email=f'testvendor{number}@example.com',
+                name=f'test Vendor {number}',
+                password='testpass123',
+                vendor_data={"vendor_code": f"8765432{number}"}
+            )
+            for number in range(2)
+        ]
+        for vendor in self.vendors:
+            for number in range(2):
+                PurchaseOrder.objects.create(
+                    po_number=f"test-{vendor.id}-{number}-po",
+                    items={"testProp1": "test_string"},
+                    quantity=5,
+                    vendor=vendor
+                )
+
+    def test_export(self):
+        """
+            Test the export of one vendor as NDJSON.
+        """
+        out = StringIO()
+        call_command(
+            'export_purchase_orders',
+            file_format='ndjson',
+            vendor=self.vendors[1].id,
+            chunk_size=1,
+            stdout=out
+        )
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(
+            [json.loads(line)['po_number'] for line in lines],
+            [f"test-{self.vendors[1].id}-{number}-po" for number in range(2)]
+        )
+
+    def test_export_filters(self):
+        """
+            Test every filter of the list is an option.
+        """
+        now = timezone.now()
+        orders = list(PurchaseOrder.objects.order_by('id'))
+        PurchaseOrder.objects.filter(id=orders[0].id).update(
+            status='completed',
+            date_delivered=now - timedelta(days=1)
+        )
+        PurchaseOrder.objects.filter(id=orders[1].id).update(
+            delivery_date=now - timedelta(days=1),
+            acknowledgment_date=now
+        )
+
+        def exported(**options):
+            out = StringIO()
+            call_command(
+                'export_purchase_orders',
+                file_format='ndjson',
+                stdout=out,
+                **options
+            )
+            return [
+                json.loads(line)['po_number']
+                for line in out.getvalue().splitlines()
+            ]
+
+        since = (now - timedelta(days=2)).isoformat()
+        self.assertEqual(
+            exported(date_delivered_after=since),
+            [orders[0].po_number]
+        )
+        self.assertEqual(exported(overdue='true'), [orders[1].po_number])
+        self.assertEqual(exported(acknowledged='true'), [orders[1].po_number])
+        self.assertEqual(
+            exported(delivery_date_before=now.isoformat(), overdue='false'),
+            []
+        )
+
+    def test_invalid_filter(self):
+        """
+            Test invalid filters stop the command.
+        """
+        with self.assertRaises(CommandError):
+            call_command('export_purchase_orders', status='unknown')
+
+
+class ImportPurchaseOrdersTest(TestCase):
+    """
+        Unit test for import_purchase_orders command.
+    """
+
+    def setUp(self):
+        """
+            Set up data for testing.
+        """
+        self.vendor = get_user_model().objects.create_vendor(
+            email='testvendor@example.com',
+            name='test Vendor',
+            password='testpass123',
+            vendor_data={"vendor_code": "87654320"}
+        )
+        for number in range(3):
+            PurchaseOrder.objects.create(
+                po_number=f"test-{number}-po",
+                items={"testProp1": "test_string"},
+                quantity=5,
+                vendor=self.vendor
+            )
+
+    def test_export_then_import(self):
+        """
+            Test an export is imported back after its orders
+            are deleted, in batches.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'orders.csv')
+            call_command(
+                'export_purchase_orders',
+                output=path,
+                stderr=StringIO()
+            )
+            PurchaseOrder.objects.all().delete()
+
+            out = StringIO()
+            call_command(
+                'import_purchase_orders',
+                path,
+                batch_size=2,
+                stdout=out
+            )
+
+        self.assertIn(
+            'Imported 3 purchase orders with 0 errors',
+            out.getvalue()
+        )
+        self.assertEqual(
+            sorted(PurchaseOrder.objects.values_list('po_number', flat=True)),
+            [f"test-{number}-po" for number in range(3)]
+        )
+        self.assertEqual(
+            VendorPerformance.objects.get(vendor=self.vendor).po_issued,
+            3
+        )
+
+    def test_round_trip_completed_order(self):
+        """
+            Test a completed order keeps its dates, status
+            and rating, and the performance data is the
+            same after an export and import.
+        """
+        order = PurchaseOrder.objects.get(po_number='test-0-po')
+        order.acknowledgment_date = order.order_date + timedelta(hours=5)
+        order.save()
+        order.status = 'completed'
+        order.quality_rating = 7
+        order.save()
+
+        fields = [
+            'po_number', 'order_date', 'delivery_date', 'status',
+            'quality_rating', 'acknowledgment_date', 'date_delivered'
+        ]
+        counters = VendorPerformance.COUNTER_FIELDS
+        orders = list(PurchaseOrder.objects.order_by('id').values(*fields))
+        performance = VendorPerformance.objects.values(*counters).get()
+        rollups = list(
+            DailyVendorPerformance.objects.order_by('day').values(*counters)
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'orders.csv')
+            call_command(
+                'export_purchase_orders',
+                output=path,
+                stderr=StringIO()
+            )
+            PurchaseOrder.objects.all().delete()
+            self.assertEqual(
+                VendorPerformance.objects.get().po_issued,
+                0
+            )
+            call_command('import_purchase_orders', path, stdout=StringIO())
+
+        self.assertEqual(
+            list(PurchaseOrder.objects.order_by('id').values(*fields)),
+            orders
+        )
+        self.assertEqual(
+            VendorPerformance.objects.values(*counters).get(),
+            performance
+        )
+        self.assertEqual(
+            list(
+                DailyVendorPerformance.objects.order_by('day').values(
+                    *counters
+                )
+            ),
+            rollups
+        )
+
+    def test_historical_order_without_delivery_date(self):
+        """
+            Test an order placed long ago is due a delivery
+            period after its order date, so a late delivery
+            is not counted as on time.
+        """
+        order_date = timezone.now() - timedelta(days=60)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'orders.ndjson')
+            with open(path, 'w') as output:
+                output.write(json.dumps({
+                    'po_number': 'test-old-po',
+                    'items': {'a': 1},
+                    'quantity': 5,
+                    'vendor': self.vendor.id,
+                    'order_date': order_date.isoformat(),
+                    'status': 'completed',
+                    'date_delivered': (
+                        order_date + timedelta(days=20)
+                    ).isoformat()
+                }) + '\n')
+
+            call_command('import_purchase_orders', path, stdout=StringIO())
+
+        order = PurchaseOrder.objects.get(po_number='test-old-po')
+        self.assertEqual(
+            order.delivery_date,
+            order_date + timedelta(days=10)
+        )
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(perf_ins.po_delivered, 1)
+        self.assertEqual(perf_ins.po_delivered_on_time, 0)
+
+    def test_inconsistent_rows(self):
+        """
+            Test rows the API could not have produced are
+            reported.
+        """
+        now = timezone.now()
+        rows = [
+            {'status': 'completed'},
+            {
+                'quality_rating': 5,
+                'date_delivered': (now + timedelta(1)).isoformat()
+            },
+            {
+                'order_date': now.isoformat(),
+                'acknowledgment_date': (now - timedelta(1)).isoformat()
+            },
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'orders.ndjson')
+            with open(path, 'w') as output:
+                for number, row in enumerate(rows):
+                    output.write(json.dumps({
+                        'po_number': f'test-new-{number}-po',
+                        'items': {'a': number},
+                        'quantity': 5,
+                        'vendor': self.vendor.id,
+                        **row
+                    }) + '\n')
+
+            err = StringIO()
+            call_command(
+                'import_purchase_orders',
+                path,
+                stdout=StringIO(),
+                stderr=err
+            )
+
+        self.assertEqual(
+            err.getvalue().splitlines(),
+            [
+                'Row 1: {"date_delivered": '
+                '["Required for completed orders."]}',
+                'Row 2: {"date_delivered": '
+                '["Only completed orders have this value."], '
+                '"quality_rating": '
+                '["Only completed orders have this value."]}',
+                'Row 3: {"acknowledgment_date": '
+                '["Earlier than the order date."]}',
+            ]
+        )
+        self.assertFalse(
+            PurchaseOrder.objects.filter(po_number__startswith='test-new')
+        )
+
+    def test_unknown_format(self):
+        """
+            Test the format is needed for other extensions.
+        """
+        with self.assertRaises(CommandError):
+            call_command('import_purchase_orders', 'orders.txt')
@@ -0,0 +1,100 @@
+"""
+    Concurrency tests for vendor performance counters.
+"""
+import threading
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.contrib.auth import get_user_model
+
+from order.models import PurchaseOrder
+from vendor.models import (
+    VendorPerformance,
+    DailyVendorPerformance
+)
+
+
+class ConcurrentCounterUpdatesTest(TransactionTestCase):
+    """
+        Hammer the counters of one vendor from many
+        threads and check no increment is lost.
+    """
+    threads = 8
+    orders_per_thread = 10
+
+    def setUp(self):
+        """
+            Set up data for testing.
+        """
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            self.skipTest('Threads need a file backed SQLite test database.')
+
+        self.vendor = get_user_model().objects.create_vendor(
+            email='testvendor@example.com',
+            name='test Vendor',
+            password='testpass123',
+            vendor_data={
+                "contact_details": "contact me here",
+                "address": "test address, street one, india",
+                "vendor_code": "87654321"
+            }
+        )
+
+    def run_threads(self, target):
+        """
+            Run target in parallel threads and re-raise
+            the first error of any of them.
+        """
+        errors = []
+        barrier = threading.Barrier(self.threads)
+
+        def run(number):
+            try:
+                barrier.wait()
+                target(number)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connection.close()
+
+        workers = [
+            threading.Thread(target=run, args=(number,))
+            for number in range(self.threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        if errors:
+            raise errors[0]
+
+    def test_parallel_order_lifecycle(self):
+        """
+            Test creating and completing orders in parallel
+            counts every order exactly once.
+        """
+        def create_and_complete(number):
+            for index in range(self.orders_per_thread):
+                order = PurchaseOrder.objects.create(
+                    po_number=f"test-{number}-{index}-po",
+                    items={"testProp1": "test_string"},
+                    quantity=5,
+                    vendor=self.vendor
+                )
+                order.status = 'completed'
+                order.quality_rating = 5
+                order.save()
+
+        self.run_threads(create_and_complete)
+
+        total = self.threads * self.orders_per_thread
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(perf_ins.po_issued, total)
+        self.assertEqual(perf_ins.po_delivered, total)
+        self.assertEqual(perf_ins.quality_rating_count, total)
+        self.assertEqual(perf_ins.fulfillment_rate, 1.0)
+
+        rollup = DailyVendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(rollup.po_issued, total)
+        self.assertEqual(rollup.po_delivered, total)
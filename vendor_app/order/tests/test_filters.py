@@ -0,0 +1,151 @@
+"""
+    Unit tests for purchase order filters.
+"""
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from order.models import PurchaseOrder
+
+
+class PurchaseOrderFilterTest(TestCase):
+    """
+        Unit test for filtering the purchase order list.
+    """
+
+    def setUp(self):
+        """
+            Setup data for testing.
+        """
+        self.client = APIClient()
+        self.vendors = [
+            get_user_model().objects.create_vendor(
+                email=f'testuser{number}@example.com',
+                name=f'test Vendor {number}',
+                password='testpass123',
+                vendor_data={"vendor_code": f"8765432{number}"}
+            )
+            for number in range(2)
+        ]
+
+        for vendor in self.vendors:
+            for number in range(3):
+                PurchaseOrder.objects.create(
+                    po_number=f"test-{vendor.id}-{number}-po",
+                    items={"testProp1": "test_string"},
+                    quantity=5,
+                    vendor=vendor
+                )
+
+        # Acknowledged and completed order of the first vendor.
+        order = PurchaseOrder.objects.get(
+            po_number=f"test-{self.vendors[0].id}-0-po"
+        )
+        order.acknowledgment_date = timezone.now()
+        order.save()
+        order.status = 'completed'
+        order.save()
+
+        # Open order past its delivery date.
+        PurchaseOrder.objects.filter(
+            po_number=f"test-{self.vendors[0].id}-1-po"
+        ).update(delivery_date=timezone.now() - timedelta(days=1))
+
+        response = self.client.post(
+            reverse('obtain-token-pair'),
+            {
+                "email": "testuser0@example.com",
+                "password": 'testpass123'
+            }
+        )
+        self.headers = {
+            'Authorization': f"Bearer {response.json().get('access')}"
+        }
+        self.url = reverse('list-create-purchase-order')
+
+    def po_numbers(self, params):
+        """
+            Purchase order numbers listed with the filters.
+        """
+        response = self.client.get(self.url, params, headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        return [row['po_number'] for row in response.json()['results']]
+
+    def test_filters(self):
+        """
+            Test each filter of the list.
+        """
+        vendor_id = self.vendors[0].id
+
+        self.assertEqual(
+            self.po_numbers({'vendor': vendor_id}),
+            [f"test-{vendor_id}-{number}-po" for number in range(3)]
+        )
+        self.assertEqual(
+            self.po_numbers({'status': 'completed'}),
+            [f"test-{vendor_id}-0-po"]
+        )
+        self.assertEqual(
+            self.po_numbers({'acknowledged': 'true'}),
+            [f"test-{vendor_id}-0-po"]
+        )
+        self.assertEqual(len(self.po_numbers({'acknowledged': 'false'})), 5)
+        self.assertEqual(
+            self.po_numbers({'overdue': 'true'}),
+            [f"test-{vendor_id}-1-po"]
+        )
+        self.assertEqual(
+            self.po_numbers({
+                'delivery_date_before': timezone.now().isoformat()
+            }),
+            [f"test-{vendor_id}-1-po"]
+        )
+        self.assertEqual(
+            self.po_numbers({
+                'order_date_after': (
+                    timezone.now() + timedelta(days=1)
+                ).isoformat()
+            }),
+            []
+        )
+
+    def plan(self, params):
+        """
+            Query plan of the page query of a filtered list.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, params, headers=self.headers)
+
+        sql = next(
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and
+            'FROM "order_purchaseorder"' in query['sql']
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return ' '.join(str(row[-1]) for row in cursor.fetchall())
+
+    @skipUnless(
+        connection.vendor == 'sqlite',
+        'Query plans checked on SQLite.'
+    )
+    def test_filters_use_indexes(self):
+        """
+            Test filtered pages are read from indexes.
+        """
+        plan = self.plan({'vendor': self.vendors[0].id})
+        self.assertIn('po_vendor_order_date_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+        plan = self.plan({})
+        self.assertIn('po_order_date_idx', plan)
+
+        plan = self.plan({'overdue': 'true'})
+        self.assertIn('po_status_delivery_idx', plan)
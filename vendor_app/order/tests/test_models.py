@@ -2,6 +2,9 @@
     Unit tests for Purchase order model.
 """
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from unittest import skipUnless
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 
@@ -126,3 +129,87 @@ class PurchaseOrderModelTest(TestCase):
             # Create an instance with a positive rating
             purchase_order.quality_rating = 10.1
             purchase_order.full_clean()
+
+    def test_changed_fields(self):
+        """
+            Test tracking of values loaded from database.
+        """
+        PurchaseOrder.objects.create(
+            po_number="po-n124",
+            vendor=self.vendor,
+            items={"item1": {"quantity": 20}},
+            quantity=30
+        )
+        purchase_order = PurchaseOrder.objects.get(po_number="po-n124")
+
+        self.assertEqual(purchase_order.changed_fields(), set())
+
+        purchase_order.status = 'out-to-deliver'
+        purchase_order.items['item1']['quantity'] = 10
+
+        self.assertEqual(
+            purchase_order.changed_fields(),
+            {'status', 'items'}
+        )
+        self.assertEqual(purchase_order.loaded_value('status'), 'pending')
+
+        # Saving makes the saved values the loaded ones.
+        purchase_order.save()
+        self.assertEqual(purchase_order.changed_fields(), set())
+        self.assertEqual(
+            purchase_order.loaded_value('status'),
+            'out-to-deliver'
+        )
+
+        # Deferred fields are fetched when asked for.
+        purchase_order = PurchaseOrder.objects.only('id').get(
+            po_number="po-n124"
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(purchase_order.loaded_value('quantity'), 30)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Query plans checked on SQLite.')
+class PerformanceCountersQueryPlanTest(TestCase):
+    """
+        Check the vendor performance aggregates read
+        only one vendor's purchase orders via indexes.
+    """
+
+    def setUp(self):
+        """
+            configure requirements for test.
+        """
+        self.vendor = get_user_model().objects.create_vendor(
+            email='test@example.com',
+            name='test Vendor',
+            password='testpass123',
+            vendor_data={
+                "contact_details": "contact me here",
+                "address": "test address, street one, india",
+                "vendor_code": "87654324"
+            }
+        )
+
+    def test_aggregates_use_vendor_indexes(self):
+        """
+            Test every aggregate query searches an index
+            instead of scanning the table.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            PurchaseOrder.objects.performance_counters([self.vendor.id])
+
+        plans = []
+        with connection.cursor() as cursor:
+            for query in queries.captured_queries:
+                cursor.execute(f"EXPLAIN QUERY PLAN {query['sql']}")
+                plans.append(
+                    ' '.join(str(row[-1]) for row in cursor.fetchall())
+                )
+
+        self.assertEqual(len(plans), 3)
+        for plan in plans:
+            self.assertNotIn('SCAN order_purchaseorder', plan)
+
+        self.assertIn('po_vendor_status_delivered_idx', plans[1])
+        self.assertIn('po_vendor_ack_idx', plans[2])
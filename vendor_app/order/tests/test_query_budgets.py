@@ -0,0 +1,102 @@
+"""
+    Query budgets of the purchase order endpoints and admin pages.
+"""
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from order.models import PurchaseOrder
+from vendor.tests.budgets import QueryBudgetMixin
+
+
+class PurchaseOrderQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """
+        Unit test for the number of queries of purchase order pages.
+    """
+
+    def setUp(self):
+        """
+            Setup data for testing.
+        """
+        self.vendor = self.add_rows(1)[0]
+        self.client = APIClient()
+        self.client.credentials(
+            HTTP_AUTHORIZATION='Bearer '
+            f'{RefreshToken.for_user(self.vendor).access_token}'
+        )
+
+    def test_purchase_order_list(self):
+        """
+            Test the list runs one query after authentication.
+        """
+        self.assert_query_budget(
+            2,
+            lambda: self.client.get(
+                reverse('list-create-purchase-order'),
+                {'status': 'pending'}
+            )
+        )
+
+    def test_purchase_order_detail(self):
+        """
+            Test a purchase order is read with one query.
+        """
+        order = PurchaseOrder.objects.first()
+        self.assert_query_budget(
+            2,
+            lambda: self.client.get(
+                reverse('manage-purchase-order', kwargs={'id': order.id})
+            )
+        )
+
+    def test_export(self):
+        """
+            Test the export reads the orders with one query.
+        """
+        self.assert_query_budget(
+            2,
+            lambda: self.client.get(reverse('export-purchase-order'))
+        )
+
+
+class PurchaseOrderAdminQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """
+        Unit test for the number of queries of purchase order
+        admin pages.
+    """
+
+    def setUp(self):
+        """
+            Setup data for testing.
+        """
+        self.add_rows(1)
+        self.client.force_login(
+            get_user_model().objects.create_superuser(
+                'admin@example.com',
+                'admin',
+                'testpass123'
+            )
+        )
+
+    def test_changelist(self):
+        """
+            Test the change list reads vendors with a join.
+        """
+        self.assert_query_budget(
+            8,
+            lambda: self.client.get(
+                reverse('admin:order_purchaseorder_changelist')
+            )
+        )
+
+    def test_change_page(self):
+        """
+            Test the change page does not grow with vendors.
+        """
+        url = reverse(
+            'admin:order_purchaseorder_change',
+            args=[PurchaseOrder.objects.first().id]
+        )
+        self.assert_query_budget(8, lambda: self.client.get(url))
@@ -6,9 +6,12 @@ from django.utils import timezone
 from datetime import timedelta
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from order.models import PurchaseOrder
 from vendor.models import (
+    DailyVendorPerformance,
     VendorPerformance
 )
 
@@ -206,3 +209,155 @@ class TestPurchaseOrderSignals(TestCase):
             round(perf_ins.fulfillment_rate, 2),
             expected_fulfillment_rate
         )
+
+    def test_counters_survive_cache_flush(self):
+        """
+            Test counters are persisted in VendorPerformance
+            and do not depend on the cache.
+        """
+        self.purchase_order1.acknowledgment_date = (
+            timezone.now() + timedelta(days=2)
+        )
+        self.purchase_order1.save()
+
+        # Drop anything a cache could hold between saves.
+        cache.clear()
+
+        self.purchase_order1.status = 'completed'
+        self.purchase_order1.quality_rating = 9
+        self.purchase_order1.save()
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+
+        self.assertEqual(perf_ins.po_issued, 3)
+        self.assertEqual(perf_ins.po_delivered, 1)
+        self.assertEqual(perf_ins.po_delivered_on_time, 1)
+        self.assertEqual(perf_ins.quality_rating_count, 1)
+        self.assertEqual(perf_ins.res_count, 1)
+        self.assertEqual(perf_ins.average_response_time, 2.0)
+        self.assertEqual(perf_ins.quality_rating_avg, 9.0)
+
+    def test_late_delivery_lowers_on_time_rate(self):
+        """
+            Test a late delivery is counted against
+            the on time delivery rate.
+        """
+        self.purchase_order1.status = 'completed'
+        self.purchase_order1.save()
+
+        # Delivery date already passed.
+        self.purchase_order2.delivery_date = (
+            timezone.now() - timedelta(days=1)
+        )
+        self.purchase_order2.status = 'completed'
+        self.purchase_order2.save()
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+
+        self.assertEqual(perf_ins.on_time_delivery_rate, 0.5)
+
+        # Saving a completed order again does not count twice.
+        self.purchase_order2.save()
+        perf_ins.refresh_from_db()
+
+        self.assertEqual(perf_ins.po_delivered, 2)
+
+    def test_update_does_not_refetch_order(self):
+        """
+            Test signals compare with the loaded values
+            instead of fetching the order again.
+        """
+        purchase_order = PurchaseOrder.objects.get(id=self.purchase_order1.id)
+        purchase_order.acknowledgment_date = timezone.now()
+
+        with CaptureQueriesContext(connection) as queries:
+            purchase_order.save()
+
+        selects = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and
+            'order_purchaseorder' in query['sql']
+        ]
+        self.assertEqual(selects, [])
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(perf_ins.res_count, 1)
+
+    def test_delete_order_recorded_before_counters(self):
+        """
+            Test deleting an order the counters never saw
+            leaves them at zero instead of failing.
+        """
+        VendorPerformance.objects.filter(vendor=self.vendor).update(
+            po_issued=0,
+            res_count=0,
+            res_time_total=timedelta()
+        )
+        DailyVendorPerformance.objects.filter(vendor=self.vendor).delete()
+        order_date = timezone.now() - timedelta(days=10)
+        [old_order] = PurchaseOrder.objects.bulk_create([
+            PurchaseOrder(
+                po_number='test-old-po',
+                items={'testProp1': 'test_string'},
+                quantity=5,
+                vendor=self.vendor,
+                order_date=order_date,
+                acknowledgment_date=order_date + timedelta(days=2),
+                delivery_date=order_date + timedelta(days=7),
+                date_delivered=order_date + timedelta(days=5),
+                status='completed',
+                quality_rating=8
+            )
+        ])
+
+        old_order.delete()
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(perf_ins.po_issued, 0)
+        self.assertEqual(perf_ins.po_delivered, 0)
+        self.assertEqual(perf_ins.quality_rating_total, 0)
+        self.assertEqual(perf_ins.res_count, 0)
+        self.assertEqual(perf_ins.res_time_total, timedelta())
+        for rollup in DailyVendorPerformance.objects.filter(
+            vendor=self.vendor
+        ):
+            self.assertEqual(rollup.po_issued, 0)
+            self.assertEqual(rollup.res_time_total, timedelta())
+
+    def test_delete_completed_order(self):
+        """
+            Test deleting an order removes its transitions
+            from the counters and the daily rollups.
+        """
+        self.purchase_order1.acknowledgment_date = (
+            self.purchase_order1.order_date + timedelta(days=2)
+        )
+        self.purchase_order1.save()
+        self.purchase_order1.status = 'completed'
+        self.purchase_order1.quality_rating = 8
+        self.purchase_order1.save()
+        self.purchase_order2.status = 'completed'
+        self.purchase_order2.save()
+
+        self.purchase_order1.delete()
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(perf_ins.po_issued, 2)
+        self.assertEqual(perf_ins.po_delivered, 1)
+        self.assertEqual(perf_ins.po_delivered_on_time, 1)
+        self.assertEqual(perf_ins.quality_rating_count, 0)
+        self.assertEqual(perf_ins.quality_rating_total, 0)
+        self.assertEqual(perf_ins.res_count, 0)
+        self.assertEqual(perf_ins.res_time_total, timedelta())
+        self.assertEqual(perf_ins.fulfillment_rate, 0.5)
+        self.assertIsNone(perf_ins.average_response_time)
+
+        rollups = DailyVendorPerformance.objects.filter(vendor=self.vendor)
+        totals = {
+            field: sum(getattr(rollup, field) for rollup in rollups)
+            for field in ['po_issued', 'po_delivered', 'res_count']
+        }
+        self.assertEqual(
+            totals,
+            {'po_issued': 2, 'po_delivered': 1, 'res_count': 0}
+        )
@@ -1,16 +1,24 @@
 """
     Unit test for views.
 """
+from unittest import mock
 
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
 
 from order.models import PurchaseOrder
+from order.pagination import PurchaseOrderPagination
+from vendor.models import VendorPerformance
 
 from order.serializers import PurchaseOrderSerializer
 
+import csv
+import io
 import json
 
 
@@ -86,7 +94,139 @@ class PurchaseOrderListCreateViewTest(TestCase):
         expected_response = PurchaseOrderSerializer(
             instance=self.purchase_order
         ).data
-        self.assertEqual(response.data[0], expected_response)
+        self.assertEqual(
+            response.data['results'][0],
+            expected_response
+        )
+
+    def test_paging_purchase_orders(self):
+        """
+            Test the list is paged with cursors.
+        """
+        for number in range(4):
+            PurchaseOrder.objects.create(
+                po_number=f"test-page-{number}-po",
+                items={"testProp1": "test_string"},
+                quantity=5,
+                vendor=self.vendor
+            )
+
+        response = self.client.get(
+            self.url,
+            {'page_size': 2},
+            headers=self.headers
+        )
+        data = response.json()
+        self.assertEqual(
+            [row['po_number'] for row in data['results']],
+            ['test-123-po', 'test-page-0-po']
+        )
+
+        seen = []
+        while data['next']:
+            data = self.client.get(data['next'], headers=self.headers).json()
+            seen += [row['po_number'] for row in data['results']]
+        self.assertEqual(
+            seen,
+            ['test-page-1-po', 'test-page-2-po', 'test-page-3-po']
+        )
+
+        # Page size is capped.
+        with mock.patch.object(PurchaseOrderPagination, 'max_page_size', 3):
+            response = self.client.get(
+                self.url,
+                {'page_size': 100000},
+                headers=self.headers
+            )
+        self.assertEqual(len(response.json()['results']), 3)
+
+    def test_paging_tied_order_dates(self):
+        """
+            Test orders sharing an order date are paged by
+            id, forwards and backwards, without an offset.
+        """
+        for number in range(4):
+            PurchaseOrder.objects.create(
+                po_number=f"test-page-{number}-po",
+                items={"testProp1": "test_string"},
+                quantity=5,
+                vendor=self.vendor
+            )
+        PurchaseOrder.objects.update(order_date=self.purchase_order.order_date)
+        ids = list(
+            PurchaseOrder.objects.order_by('id').values_list('id', flat=True)
+        )
+
+        pages = []
+        response = self.client.get(
+            self.url,
+            {'page_size': 2},
+            headers=self.headers
+        )
+        while True:
+            pages.append([row['id'] for row in response.json()['results']])
+            if response.json()['next'] is None:
+                break
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(
+                    response.json()['next'],
+                    headers=self.headers
+                )
+            self.assertFalse([
+                query for query in queries
+                if 'OFFSET' in query['sql'] and 'order_' in query['sql']
+            ])
+        self.assertEqual(pages, [ids[:2], ids[2:4], ids[4:]])
+
+        response = self.client.get(
+            response.json()['previous'],
+            headers=self.headers
+        )
+        self.assertEqual(
+            [row['id'] for row in response.json()['results']],
+            ids[2:4]
+        )
+
+    def test_sparse_fieldset(self):
+        """
+            Test the list renders and loads only the
+            fields asked for.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.url,
+                {'fields': 'po_number,status'},
+                headers=self.headers
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()['results'],
+            [{'po_number': 'test-123-po', 'status': 'pending'}]
+        )
+
+        sql = next(
+            query['sql'] for query in queries.captured_queries
+            if 'FROM "order_purchaseorder"' in query['sql']
+        )
+        self.assertIn('"po_number"', sql)
+        self.assertNotIn('"items"', sql)
+
+        response = self.client.get(
+            self.url,
+            {'exclude': 'items,vendor'},
+            headers=self.headers
+        )
+        row = response.json()['results'][0]
+        self.assertNotIn('items', row)
+        self.assertNotIn('vendor', row)
+        self.assertIn('quantity', row)
+
+        response = self.client.get(
+            self.url,
+            {'fields': 'po_number,unknown'},
+            headers=self.headers
+        )
+        self.assertEqual(response.status_code, 400)
 
     def test_creating_purchase_order(self):
         """
@@ -116,6 +256,441 @@ class PurchaseOrderListCreateViewTest(TestCase):
         self.assertIsNotNone(new_po)
 
 
+class BulkCreatePurchaseOrderViewTest(TestCase):
+    """
+        Unit test for BulkCreatePurchaseOrderView.
+    """
+
+    def setUp(self):
+        """
+            Setup data for testing.
+        """
+        self.client = APIClient()
+
+        self.vendor = get_user_model().objects.create_vendor(
+            email='testuser123@example.com',
+            name='test Vendor',
+            password='testpass1234',
+            vendor_data={
+                "contact_details": "test contact details",
+                "address": "test address, street one, India",
+                "vendor_code": "87654324"
+            }
+        )
+
+        # Generate access token
+        input_data = {
+            "email": "testuser123@example.com",
+            "password": 'testpass1234'
+        }
+        access_token_url = reverse('obtain-token-pair')
+        response = self.client.post(access_token_url, input_data)
+        self.access_token = response.json().get('access')
+
+        self.url = reverse('bulk-create-purchase-order')
+        self.headers = {'Authorization': f'Bearer {self.access_token}'}
+
+    def po_data(self, count):
+        """
+            Build payload for the given number of orders.
+        """
+        return [
+            {
+                "po_number": f"bulk-{number}-po",
+                "items": {"testProp1": "test_string"},
+                "quantity": 5,
+                "vendor": self.vendor.id
+            }
+            for number in range(count)
+        ]
+
+    def test_bulk_create(self):
+        """
+            Test POST request creates all orders and
+            updates the vendor performance once.
+        """
+        response = self.client.post(
+            self.url,
+            self.po_data(25),
+            headers=self.headers,
+            format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {'created': 25})
+        self.assertEqual(
+            PurchaseOrder.objects.filter(vendor=self.vendor).count(),
+            25
+        )
+        self.assertIsNotNone(
+            PurchaseOrder.objects.first().delivery_date
+        )
+
+        perf_ins = VendorPerformance.objects.get(vendor=self.vendor)
+        self.assertEqual(perf_ins.po_issued, 25)
+        self.assertEqual(perf_ins.fulfillment_rate, 0.0)
+
+    def test_bulk_create_queries(self):
+        """
+            Test the validation reads do not grow with the
+            number of rows.
+        """
+        # The first orders of the day create the daily rollup.
+        self.client.post(
+            self.url,
+            self.po_data(1),
+            headers=self.headers,
+            format='json'
+        )
+
+        counts = []
+        for count in [10, 200]:
+            data = [
+                {**row, 'po_number': f"{count}-{row['po_number']}"}
+                for row in self.po_data(count)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    self.url,
+                    data,
+                    headers=self.headers,
+                    format='json'
+                )
+            self.assertEqual(response.status_code, 201)
+            # SQLite splits the inserts by its parameter limit.
+            counts.append(len([
+                query for query in queries
+                if query['sql'].startswith('SELECT')
+            ]))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_bulk_create_existing_po_number(self):
+        """
+            Test the rows using an existing po number are
+            reported and nothing is created.
+        """
+        self.client.post(
+            self.url,
+            self.po_data(1),
+            headers=self.headers,
+            format='json'
+        )
+
+        response = self.client.post(
+            self.url,
+            self.po_data(3),
+            headers=self.headers,
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            [
+                {'po_number': [
+                    'purchase order with this po number already exists.'
+                ]},
+                {},
+                {}
+            ]
+        )
+        self.assertEqual(PurchaseOrder.objects.count(), 1)
+
+    def test_bulk_create_invalid_row(self):
+        """
+            Test one invalid row rejects the whole batch.
+        """
+        data = self.po_data(3)
+        data[1]['quantity'] = -1
+
+        response = self.client.post(
+            self.url,
+            data,
+            headers=self.headers,
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(PurchaseOrder.objects.exists())
+
+    def test_bulk_create_duplicate_po_number(self):
+        """
+            Test duplicated po numbers inside a batch
+            roll back the whole batch.
+        """
+        data = self.po_data(2)
+        data[1]['po_number'] = data[0]['po_number']
+
+        response = self.client.post(
+            self.url,
+            data,
+            headers=self.headers,
+            format='json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(PurchaseOrder.objects.exists())
+        self.assertEqual(
+            VendorPerformance.objects.get(vendor=self.vendor).po_issued,
+            0
+        )
+
+
+class ExportPurchaseOrderViewTest(TestCase):
+    """
+        Unit test for ExportPurchaseOrderView.
+    """
+
+    def setUp(self):
+        """
+            Setup data for testing.
+        """
+        self.client = APIClient()
+        self.vendors = [
+            get_user_model().objects.create_vendor(
+                email=f'testuser{number}@example.com',
+                name=f'test Vendor {number}',
+                password='testpass123',
+                vendor_data={"vendor_code": f"8765432{number}"}
+            )
+            for number in range(2)
+        ]
+        for vendor in self.vendors:
+            for number in range(3):
+                PurchaseOrder.objects.create(
+                    po_number=f"test-{vendor.id}-{number}-po",
+                    items={"testProp1": "test, \"quoted\""},
+                    quantity=5,
+                    vendor=vendor
+                )
+
+        response = self.client.post(
+            reverse('obtain-token-pair'),
+            {
+                "email": "testuser0@example.com",
+                "password": 'testpass123'
+            }
+        )
+        self.headers = {
+            'Authorization': f"Bearer {response.json().get('access')}"
+        }
+        self.url = reverse('export-purchase-order')
+
+    def export(self, params):
+        response = self.client.get(self.url, params, headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode()
+
+    def test_csv_export(self):
+        """
+            Test the CSV export of a filtered list.
+        """
+        vendor = self.vendors[0]
+        rows = list(csv.reader(io.StringIO(self.export({
+            'vendor': vendor.id
+        }))))
+
+        expected = PurchaseOrderSerializer(
+            PurchaseOrder.objects.filter(vendor=vendor).order_by('id'),
+            many=True
+        ).data
+        self.assertEqual(rows[0], list(expected[0]))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(
+            [row[1] for row in rows[1:]],
+            [order['po_number'] for order in expected]
+        )
+        self.assertEqual(
+            json.loads(rows[1][rows[0].index('items')]),
+            expected[0]['items']
+        )
+
+    def test_ndjson_export(self):
+        """
+            Test the NDJSON export gives the list representation.
+        """
+        lines = self.export({
+            'file_format': 'ndjson',
+            'fields': 'po_number,status'
+        }).splitlines()
+
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(
+            json.loads(lines[0]),
+            {
+                'po_number': f"test-{self.vendors[0].id}-0-po",
+                'status': 'pending'
+            }
+        )
+
+    def test_invalid_export(self):
+        """
+            Test invalid parameters are rejected before streaming.
+        """
+        for params in [
+            {'file_format': 'xml'},
+            {'status': 'unknown'},
+            {'fields': 'unknown'},
+        ]:
+            response = self.client.get(
+                self.url,
+                params,
+                headers=self.headers
+            )
+            self.assertEqual(response.status_code, 400)
+
+
+class ImportPurchaseOrderViewTest(TestCase):
+    """
+        Unit test for ImportPurchaseOrderView.
+    """
+
+    def setUp(self):
+        """
+            Setup data for testing.
+        """
+        self.client = APIClient()
+        self.vendor = get_user_model().objects.create_vendor(
+            email='testuser@example.com',
+            name='test Vendor',
+            password='testpass123',
+            vendor_data={"vendor_code": "87654320"}
+        )
+        PurchaseOrder.objects.create(
+            po_number="test-existing-po",
+            items={"testProp1": "test_string"},
+            quantity=5,
+            vendor=self.vendor
+        )
+
+        response = self.client.post(
+            reverse('obtain-token-pair'),
+            {
+                "email": "testuser@example.com",
+                "password": 'testpass123'
+            }
+        )
+        self.headers = {
+            'Authorization': f"Bearer {response.json().get('access')}"
+        }
+        self.url = reverse('import-purchase-order')
+
+    def upload(self, content, file_format):
+        return self.client.post(
+            self.url,
+            {
+                'file': SimpleUploadedFile(f'orders.{file_format}', content),
+                'file_format': file_format,
+            },
+            headers=self.headers
+        )
+
+    def test_csv_import(self):
+        """
+            Test valid rows are imported and invalid rows reported.
+        """
+        content = (
+            'po_number,items,quantity,vendor\r\n'
+            f'test-1-po,"{{""a"": 1}}",5,{self.vendor.id}\r\n'
+            f'test-2-po,"{{""a"": 2}}",7,{self.vendor.id}\r\n'
+            f'test-3-po,"{{""a"": 3}}",not a number,{self.vendor.id}\r\n'
+            f'test-existing-po,"{{""a"": 4}}",5,{self.vendor.id}\r\n'
+            f'test-1-po,"{{""a"": 5}}",5,{self.vendor.id}\r\n'
+            'test-6-po,"{""a"": 6}",5,999\r\n'
+        ).encode()
+
+        response = self.upload(content, 'csv')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+
+        self.assertEqual(data['created'], 2)
+        self.assertEqual(data['error_count'], 4)
+        self.assertEqual(
+            [
+                (error['row'], list(error['errors']))
+                for error in data['errors']
+            ],
+            [
+                (4, ['quantity']),
+                (7, ['vendor']),
+                (5, ['po_number']),
+                (6, ['po_number']),
+            ]
+        )
+        self.assertEqual(
+            PurchaseOrder.objects.get(po_number='test-2-po').items,
+            {'a': 2}
+        )
+        self.assertEqual(
+            VendorPerformance.objects.get(vendor=self.vendor).po_issued,
+            3
+        )
+
+    def test_concurrent_duplicate(self):
+        """
+            Test only the rows inserted by someone else
+            after the check are reported as duplicates.
+        """
+        bulk_ingest = PurchaseOrder.objects.bulk_ingest
+
+        def concurrent(rows, **kwargs):
+            if not PurchaseOrder.objects.filter(po_number='test-2-po'):
+                PurchaseOrder.objects.create(
+                    po_number='test-2-po',
+                    items={"testProp1": "test_string"},
+                    quantity=5,
+                    vendor=self.vendor
+                )
+            return bulk_ingest(rows, **kwargs)
+
+        content = ''.join(
+            f'test-{number}-po,"{{""a"": {number}}}",5,{self.vendor.id}\r\n'
+            for number in range(1, 4)
+        )
+        with mock.patch.object(
+            PurchaseOrder.objects,
+            'bulk_ingest',
+            side_effect=concurrent
+        ):
+            response = self.upload(
+                f'po_number,items,quantity,vendor\r\n{content}'.encode(),
+                'csv'
+            )
+
+        data = response.json()
+        self.assertEqual(data['created'], 2)
+        self.assertEqual(
+            [(error['row'], error['errors']) for error in data['errors']],
+            [(3, {'po_number': ['Duplicate po_number.']})]
+        )
+        self.assertEqual(
+            PurchaseOrder.objects.get(po_number='test-3-po').items,
+            {'a': 3}
+        )
+
+    def test_ndjson_import(self):
+        """
+            Test NDJSON rows, including one that is not JSON.
+        """
+        content = (
+            json.dumps({
+                'po_number': 'test-1-po',
+                'items': {'a': 1},
+                'quantity': 5,
+                'vendor': self.vendor.id
+            }) + '\n{"po_number": \n'
+        ).encode()
+
+        response = self.upload(content, 'ndjson')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['created'], 1)
+        self.assertEqual(response.json()['errors'][0]['row'], 2)
+
+    def test_missing_file(self):
+        """
+            Test the upload needs a file.
+        """
+        response = self.client.post(self.url, {}, headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+
+
 class ManagePurchaseOrderViewTest(TestCase):
     """
         Unit test for ManagePurchaseOrderView.
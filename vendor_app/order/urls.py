@@ -5,6 +5,9 @@
 from django.urls import path
 from .views import (
     PurchaseOrderListCreateView,
+    BulkCreatePurchaseOrderView,
+    ExportPurchaseOrderView,
+    ImportPurchaseOrderView,
     ManagePurchaseOrderView,
     AcknowledgePOView,
     MarkCompletedView
@@ -17,6 +20,21 @@ urlpatterns = [
         PurchaseOrderListCreateView.as_view(),
         name='list-create-purchase-order'
     ),
+    path(
+        'bulk',
+        BulkCreatePurchaseOrderView.as_view(),
+        name='bulk-create-purchase-order'
+    ),
+    path(
+        'export',
+        ExportPurchaseOrderView.as_view(),
+        name='export-purchase-order'
+    ),
+    path(
+        'import',
+        ImportPurchaseOrderView.as_view(),
+        name='import-purchase-order'
+    ),
     path(
         '<str:id>',
         ManagePurchaseOrderView.as_view(),
@@ -2,57 +2,220 @@
     Views to handle orders.
 """
 from rest_framework.generics import (
+    GenericAPIView,
     ListCreateAPIView,
     RetrieveUpdateDestroyAPIView
 )
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework import permissions
 from rest_framework import status
+from rest_framework.parsers import MultiPartParser
 
+from django_filters.rest_framework import DjangoFilterBackend
+
+from django.db import IntegrityError
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+
+from vendor.mixins import SparseQuerysetMixin
+from vendor.throttling import BucketRateThrottle
+from vendor.values import ValuesListMixin
 
 from .models import (
     PurchaseOrder,
 )
 from .serializers import (
+    BulkPurchaseOrderSerializer,
     PurchaseOrderSerializer,
-    PO_CompleteSerializer
+    PO_CompleteSerializer,
+    ExportQuerySerializer,
+    ImportFileSerializer
 )
+from .pagination import PurchaseOrderPagination
+from .filters import PurchaseOrderFilter
+from .export import (
+    FORMATS,
+    export_purchase_orders
+)
+from .imports import PurchaseOrderImport
 
 
-class PurchaseOrderListCreateView(ListCreateAPIView):
+class PurchaseOrderListCreateView(
+    ValuesListMixin,
+    SparseQuerysetMixin,
+    ListCreateAPIView
+):
     """
         List all purchase orders with GET method.
         Create New Purchase order with PUT method.
+
+        The list is paged, follow the next link of the
+        response. Use page_size to change the page length.
+
+        Filter with vendor, status, acknowledged, overdue
+        and the _after/_before ranges of order_date,
+        delivery_date and date_delivered.
+
+        Use fields / exclude (comma separated names)
+        to get only some fields of each order.
+    """
+    serializer_class = PurchaseOrderSerializer
+    queryset = PurchaseOrder.objects.all()
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = PurchaseOrderPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = PurchaseOrderFilter
+    throttle_classes = [BucketRateThrottle]
+    throttle_scope = 'order_write'
+
+
+class BulkCreatePurchaseOrderView(APIView):
+    """
+        Create many purchase orders with one POST request.
+
+        Send a list of purchase orders. They are inserted
+        in chunks inside one transaction and the vendor
+        performance data is updated once per vendor.
+    """
+    serializer_class = BulkPurchaseOrderSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    batch_size = 1000
+    throttle_classes = [BucketRateThrottle]
+    throttle_scope = 'order_bulk'
+
+    @extend_schema(request=BulkPurchaseOrderSerializer(many=True))
+    def post(self, request, *args, **kwargs):
+        serializer = self.serializer_class(
+            data=request.data,
+            many=True,
+            context={'vendors': {}}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            orders = PurchaseOrder.objects.bulk_ingest(
+                serializer.validated_data,
+                batch_size=self.batch_size
+            )
+        except IntegrityError:
+            # Inserted by someone else since the check.
+            return Response(
+                "Duplicate po_number in the request.",
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            {'created': len(orders)},
+            status=status.HTTP_201_CREATED
+        )
+
+
+class ExportPurchaseOrderView(GenericAPIView):
+    """
+        Export purchase orders as a CSV or NDJSON file.
+
+        The file is streamed while the orders are read in
+        chunks, so exports of any size use little memory.
+
+        Query parameters:
+        file_format: csv (default) or ndjson.
+        The filters and fields / exclude of the list.
     """
     serializer_class = PurchaseOrderSerializer
     queryset = PurchaseOrder.objects.all()
-    authentication_classes = [JWTAuthentication]
     permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = PurchaseOrderFilter
+    pagination_class = None
+    chunk_size = 2000
 
+    @extend_schema(
+        parameters=[ExportQuerySerializer],
+        responses={200: OpenApiTypes.BINARY}
+    )
+    def get(self, request, *args, **kwargs):
+        params = ExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        file_format = params.validated_data['file_format']
 
-class ManagePurchaseOrderView(RetrieveUpdateDestroyAPIView):
+        lines = export_purchase_orders(
+            self.filter_queryset(self.get_queryset()),
+            self.get_serializer(),
+            file_format,
+            chunk_size=self.chunk_size
+        )
+
+        response = StreamingHttpResponse(
+            lines,
+            content_type=FORMATS[file_format]
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="purchase_orders.{file_format}"'
+        )
+        return response
+
+
+class ImportPurchaseOrderView(APIView):
+    """
+        Import purchase orders from an uploaded CSV or
+        NDJSON file (multipart field "file").
+
+        The file is read line by line and inserted in
+        batches. Invalid rows are skipped and reported
+        with their line number, the other rows are
+        imported. The vendor performance is updated
+        once per vendor and day of each batch.
+    """
+    serializer_class = ImportFileSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser]
+    batch_size = 1000
+    throttle_classes = [BucketRateThrottle]
+    throttle_scope = 'order_bulk'
+
+    @extend_schema(request={'multipart/form-data': ImportFileSerializer})
+    def post(self, request, *args, **kwargs):
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        result = PurchaseOrderImport(batch_size=self.batch_size).run(
+            serializer.validated_data['file'],
+            serializer.validated_data['file_format']
+        )
+
+        return Response(result.summary(), status=status.HTTP_200_OK)
+
+
+class ManagePurchaseOrderView(
+    SparseQuerysetMixin,
+    RetrieveUpdateDestroyAPIView
+):
     """
         manage order by id.
         fetch, update and delete purchase order instance.
+
+        Use fields / exclude to fetch only some fields.
     """
 
     serializer_class = PurchaseOrderSerializer
     queryset = PurchaseOrder.objects.all()
-    authentication_classes = [JWTAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = 'id'
+    throttle_classes = [BucketRateThrottle]
+    throttle_scope = 'order_write'
 
 
 class AcknowledgePOView(APIView):
     """
         Acknowledge Purchase Order.
     """
-    authentication_classes = [JWTAuthentication]
     permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = [BucketRateThrottle]
+    throttle_scope = 'order_write'
 
     def patch(self, request, *args, **kwargs):
 
@@ -80,9 +243,10 @@ class MarkCompletedView(APIView):
     """
         Mark Purchase Order as Completed.
     """
-    authentication_classes = [JWTAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = PO_CompleteSerializer
+    throttle_classes = [BucketRateThrottle]
+    throttle_scope = 'order_write'
 
     def put(self, request, *args, **kwargs):
         serializer = self.serializer_class(data=request.data)
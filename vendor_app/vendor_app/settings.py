@@ -46,6 +46,7 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt.token_blacklist',
     'drf_spectacular',
     'corsheaders',
+    'django_filters',
     'vendor',
     'order',
 ]
@@ -98,10 +99,83 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # File backed test database, so tests can open several
+        # connections (order.tests.test_concurrency).
+        'TEST': {
+            'NAME': BASE_DIR / 'test_db.sqlite3',
+        },
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Shared by all worker processes. The database cache needs no extra
+# service, create its table with: python manage.py createcachetable
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'CACHE_BACKEND',
+            'django.core.cache.backends.db.DatabaseCache'
+        ),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'vendor_app_cache'),
+        'KEY_PREFIX': 'vendor_app',
+        'VERSION': int(os.environ.get('CACHE_VERSION', 1)),
+    }
+}
+
+# Users of authenticated requests are kept in the default cache when it
+# is memcached or redis. A database cache read costs as much as the user
+# query, so with it each process keeps them in memory instead: a user
+# changed by another process is seen there after VENDOR_AUTH_CACHE_TIMEOUT.
+if CACHES['default']['BACKEND'].endswith('.DatabaseCache'):
+    CACHES['users'] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'vendor_app_users',
+    }
+
+# Token buckets of vendor.throttling.BucketRateThrottle are rows of
+# vendor.models.ThrottleBucket, taken from with one atomic upsert per
+# request. Set THROTTLE_CACHE_BACKEND to a memcached or redis cache
+# (atomic incr) to keep them there instead.
+if os.environ.get('THROTTLE_CACHE_BACKEND'):
+    CACHES['throttle'] = {
+        'BACKEND': os.environ['THROTTLE_CACHE_BACKEND'],
+        'LOCATION': os.environ.get('THROTTLE_CACHE_LOCATION'),
+        'KEY_PREFIX': 'vendor_app_throttle',
+    }
+
+# Version of the vendor metrics cache entries. Bump it to drop them all.
+VENDOR_METRICS_CACHE_VERSION = 1
+VENDOR_METRICS_CACHE_TIMEOUT = 300  # seconds
+
+# Users of authenticated requests are cached for a short time.
+VENDOR_AUTH_CACHE_VERSION = 1
+VENDOR_AUTH_CACHE_TIMEOUT = 60  # seconds
+
+# Blacklisted refresh tokens are cached, blacklisting a token or
+# removing it from the blacklist updates the cache on commit.
+VENDOR_BLACKLIST_CACHE_TIMEOUT = 300  # seconds
+
+
+# Password hashing
+# Number of PBKDF2 iterations, Django's default when not set. Stored
+# passwords are hashed again with it at the next login.
+
+PASSWORD_HASH_ITERATIONS = int(
+    os.environ.get('PASSWORD_HASH_ITERATIONS', 0)
+) or None
+
+PASSWORD_HASHERS = [
+    'vendor.hashers.TunedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 
@@ -146,13 +220,36 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Settings for Authentication.
 AUTH_USER_MODEL = 'vendor.User'
 
+# Default page length of the purchase order and vendor lists,
+# read by their pagination classes.
+API_PAGE_SIZE = int(os.environ.get('API_PAGE_SIZE', 100))
+
 # Settings for rest framework
 
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-    )
+        'vendor.authentication.CachedJWTAuthentication',
+    ),
+    # orjson backed JSON, the json module is used without orjson.
+    'DEFAULT_RENDERER_CLASSES': (
+        'vendor.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'vendor.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    # Rates of vendor.throttling.BucketRateThrottle, by the
+    # throttle_scope of the views and _user / _ip.
+    'DEFAULT_THROTTLE_RATES': {
+        'token_ip': os.environ.get('THROTTLE_TOKEN_IP', '20/min'),
+        'vendor_write_user': os.environ.get('THROTTLE_VENDOR_USER', '60/min'),
+        'vendor_write_ip': os.environ.get('THROTTLE_VENDOR_IP', '10/min'),
+        'order_write_user': os.environ.get('THROTTLE_ORDER_USER', '300/min'),
+        'order_bulk_user': os.environ.get('THROTTLE_BULK_USER', '10/min'),
+    },
 }
 
 # Settings for jwt tokens
@@ -189,13 +286,17 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
 
     "TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainPairSerializer",
-    "TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "vendor.serializers.CachedTokenRefreshSerializer",
     "TOKEN_VERIFY_SERIALIZER": "rest_framework_simplejwt.serializers.TokenVerifySerializer",
     "TOKEN_BLACKLIST_SERIALIZER": "rest_framework_simplejwt.serializers.TokenBlacklistSerializer",
     "SLIDING_TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainSlidingSerializer",
     "SLIDING_TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSlidingSerializer",
 }
 
+# Vendor performance metrics are updated inside the purchase order
+# save ("sync") or queued and applied by run_metrics_worker ("async").
+VENDOR_METRICS_MODE = os.environ.get('VENDOR_METRICS_MODE', 'sync')
+
 # Configure cors headers.
 
 CORS_ALLOWED_ORIGINS = [